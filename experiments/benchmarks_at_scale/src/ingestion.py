@@ -0,0 +1,25 @@
+import resource
+from time import time
+
+import fire
+import pandas as pd
+from statsforecast.core import StatsForecast
+from statsforecast.models import Naive
+
+
+def main(length: int = 10_000_000, method: str = 'arrow') -> None:
+    file_ = f'./data/series_{length}.parquet'
+    init = time()
+    if method == 'arrow':
+        model = StatsForecast.from_parquet(file_, models=[Naive()], freq='D')
+    else:
+        series = pd.read_parquet(file_)
+        model = StatsForecast(df=series, models=[Naive()], freq='D')
+    total_time = time() - init
+    peak_mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'method: {method} n_series: {len(model.ga):,} '
+          f'ingestion time: {total_time:.2f}s peak memory: {peak_mem:,.0f}MB')
+
+
+if __name__=="__main__":
+    fire.Fire(main)
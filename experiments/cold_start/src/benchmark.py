@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import tempfile
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+# first forecast of a fresh python process
+SCRIPT = """
+from time import time
+
+from statsforecast import StatsForecast, warmup
+from statsforecast.models import Naive, SeasonalNaive, SimpleExponentialSmoothing
+from statsforecast.utils import generate_series
+
+models = [Naive(), SeasonalNaive(season_length=7), SimpleExponentialSmoothing(alpha=0.1)]
+series = generate_series({n_series}, equal_ends=True)
+init = time()
+if {warmup}:
+    warmup(models)
+warmup_time = time() - init
+init = time()
+StatsForecast(df=series, models=models, freq='D').forecast(h=7)
+print(warmup_time, time() - init)
+"""
+
+
+def first_forecast(n_series: int, cache_dir: str, cache: bool, warmup: bool):
+    env = {**os.environ, 'NUMBA_CACHE_DIR': cache_dir, 'NUMBA_CACHE': str(cache)}
+    script = SCRIPT.format(n_series=n_series, warmup=warmup)
+    out = subprocess.run([sys.executable, '-c', script], env=env, capture_output=True, check=True, text=True)
+    warmup_time, forecast_time = map(float, out.stdout.split())
+    return warmup_time, forecast_time
+
+
+def main(n_series: int = 1_000) -> None:
+    rows = []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scenarios = [
+            ('no cache', False, False),
+            ('no cache + warmup', False, True),
+            ('cache (cold)', True, False),
+            ('cache (hot)', True, False),
+        ]
+        for name, cache, warmup in scenarios:
+            warmup_time, forecast_time = first_forecast(n_series, cache_dir, cache, warmup)
+            rows.append({'scenario': name, 'warmup (s)': warmup_time, 'first forecast (s)': forecast_time})
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt='.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
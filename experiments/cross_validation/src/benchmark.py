@@ -0,0 +1,49 @@
+import tracemalloc
+from time import perf_counter
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import HistoricAverage, Naive, SeasonalNaive, SimpleExponentialSmoothing
+from statsforecast.utils import generate_series
+
+
+def measure(fn):
+    # the time is measured without tracing the allocations, which slows down the python code
+    init = perf_counter()
+    fn()
+    elapsed = perf_counter() - init
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main(n_series: int = 100_000, h: int = 4, n_windows: int = 13) -> None:
+    series = generate_series(n_series, freq='D', min_length=100, max_length=200)
+    models = {
+        'panel models': [Naive(), SeasonalNaive(season_length=7), HistoricAverage()],
+        'SES': [SimpleExponentialSmoothing(alpha=0.1)],
+    }
+    rows = []
+    for name, models_ in models.items():
+        sf = StatsForecast(df=series, models=models_, freq='D')
+        # the first call compiles the kernels
+        sf.cross_validation(h=h, df=series.loc[[0, 1]], n_windows=2)
+        sf = StatsForecast(df=series, models=models_, freq='D')
+        elapsed, peak = measure(lambda: sf.cross_validation(h=h, n_windows=n_windows))
+        rows.append({'models': name, 'method': 'cross_validation', 'time (s)': elapsed, 'peak memory (MB)': peak})
+        if hasattr(sf, 'cross_validation_stream'):
+            def stream():
+                for _ in sf.cross_validation_stream(h=h, n_windows=n_windows):
+                    pass
+            elapsed, peak = measure(stream)
+            rows.append({'models': name, 'method': 'cross_validation_stream', 'time (s)': elapsed, 'peak memory (MB)': peak})
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,49 @@
+import tracemalloc
+from time import perf_counter
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import Naive
+from statsforecast.utils import generate_series
+
+
+def measure(fn):
+    # the time is measured without tracing the allocations, which slows down the python code
+    init = perf_counter()
+    fn()
+    elapsed = perf_counter() - init
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main(n_series: int = 500, min_length: int = 1_000, max_length: int = 2_000, h: int = 7, n_windows: int = 50) -> None:
+    series = generate_series(n_series, freq='D', min_length=min_length, max_length=max_length)
+    rows = []
+    for input_size in [None, 100]:
+        sf = StatsForecast(df=series, models=[Naive()], freq='D')
+        # the first call compiles the kernels
+        sf.cross_validation(h=h, df=series.loc[[0, 1]], n_windows=2, fitted=True)
+        sf = StatsForecast(df=series, models=[Naive()], freq='D')
+        cv = lambda: sf.cross_validation(h=h, n_windows=n_windows, input_size=input_size, fitted=True)
+        cv_time, cv_peak = measure(cv)
+        stored = sum(v.nbytes for v in sf.cv_fitted_values_.values() if hasattr(v, 'nbytes')) / 2**20
+        df_time, df_peak = measure(sf.cross_validation_fitted_values)
+        rows.append({
+            'input_size': input_size,
+            'cv time (s)': cv_time,
+            'cv peak (MB)': cv_peak,
+            'stored (MB)': stored,
+            'fitted values time (s)': df_time,
+            'fitted values peak (MB)': df_peak,
+        })
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
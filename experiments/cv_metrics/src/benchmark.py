@@ -0,0 +1,59 @@
+import tracemalloc
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import HistoricAverage, Naive, SeasonalNaive
+from statsforecast.utils import generate_series
+
+
+def measure(fn):
+    # the time is measured without tracing the allocations, which slows down the python code
+    init = perf_counter()
+    fn()
+    elapsed = perf_counter() - init
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def pandas_metrics(sf, h, n_windows, models):
+    # metrics computed with groupbys over the forecasts of cross validation, without mase
+    cv = sf.cross_validation(h=h, n_windows=n_windows)
+    errors = {}
+    for model in models:
+        err = (cv['y'] - cv[model]).abs()
+        errors[f'{model}-mae'] = err
+        errors[f'{model}-mse'] = err**2
+        errors[f'{model}-smape'] = err / (cv['y'].abs() + cv[model].abs())
+    metrics = pd.DataFrame(errors).groupby(level=0, observed=True).mean()
+    for model in models:
+        metrics[f'{model}-rmse'] = np.sqrt(metrics.pop(f'{model}-mse'))
+    return metrics
+
+
+def main(n_series: int = 100_000, h: int = 7, n_windows: int = 13) -> None:
+    series = generate_series(n_series, freq='D', min_length=100, max_length=200)
+    models = [Naive(), SeasonalNaive(season_length=7), HistoricAverage()]
+    sf = StatsForecast(df=series, models=models, freq='D')
+    # the first call compiles the kernels
+    sf.cross_validation_metrics(h=h, df=series.loc[[0, 1]], n_windows=2, season_length=7)
+    sf = StatsForecast(df=series, models=models, freq='D')
+    rows = []
+    elapsed, peak = measure(lambda: sf.cross_validation(h=h, n_windows=n_windows))
+    rows.append({'method': 'cross_validation (only the forecasts)', 'time (s)': elapsed, 'peak memory (MB)': peak})
+    elapsed, peak = measure(lambda: pandas_metrics(sf, h, n_windows, [repr(m) for m in models]))
+    rows.append({'method': 'cross_validation + groupby (mae, rmse, smape)', 'time (s)': elapsed, 'peak memory (MB)': peak})
+    elapsed, peak = measure(lambda: sf.cross_validation_metrics(h=h, n_windows=n_windows, season_length=7))
+    rows.append({'method': 'cross_validation_metrics (mae, rmse, smape, mase)', 'time (s)': elapsed, 'peak memory (MB)': peak})
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,45 @@
+from time import time
+
+import fire
+import numpy as np
+import pandas as pd
+from statsforecast.core import StatsForecast, _cv_dates
+
+
+def last_dates(n_series: int, freq: str, ragged: bool) -> pd.Index:
+    dates = pd.date_range('2000-01-01', periods=1_000, freq=freq)
+    if not ragged:
+        return pd.Index(np.repeat(dates[-1], n_series))
+    rng = np.random.default_rng(0)
+    return pd.Index(dates[-rng.integers(1, dates.size, size=n_series)])
+
+
+def timeit(f, n_runs: int = 3) -> float:
+    # best of a few runs, the first one pays for the memory allocation
+    times = []
+    for _ in range(n_runs):
+        init = time()
+        f()
+        times.append(time() - init)
+    return min(times)
+
+
+def main(n_series: int = 1_000_000, h: int = 7, test_size: int = 13) -> None:
+    rows = []
+    for freq in ['D', 'W', 'M']:
+        for ragged in [False, True]:
+            fcst = StatsForecast(models=[], freq=freq)
+            fcst.last_dates = last_dates(n_series, freq, ragged)
+            fcst.uids = pd.Index(np.arange(n_series), name='unique_id')
+            fcst.ga = range(n_series)
+            future_time = timeit(lambda: fcst._make_future_df(h=h))
+            cv_time = timeit(lambda: _cv_dates(fcst.last_dates, fcst.freq, h=h, test_size=test_size))
+            rows.append({
+                'freq': freq, 'ends': 'ragged' if ragged else 'aligned',
+                'future dates (s)': future_time, 'cv dates (s)': cv_time,
+            })
+    print(pd.DataFrame(rows).to_markdown(index=False, floatfmt='.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+from typing import Optional
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+MODULES = [
+    'statsforecast',
+    'statsforecast.models',
+    'statsforecast.arima',
+    'statsforecast.ets',
+]
+
+
+def import_time(module: str, n_runs: int = 5) -> float:
+    # best of a few fresh interpreters, numpy and pandas are imported first
+    # since every user of statsforecast pays for them anyway
+    script = f'import time, numpy, pandas; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)'
+    times = []
+    for _ in range(n_runs):
+        out = subprocess.run([sys.executable, '-c', script], capture_output=True, check=True, text=True)
+        times.append(float(out.stdout))
+    return min(times)
+
+
+def main(n_runs: int = 5, max_seconds: Optional[float] = None) -> None:
+    rows = [{'module': module, 'import time (s)': import_time(module, n_runs)} for module in MODULES]
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt='.2f'))
+    if max_seconds is not None:
+        slow = [row['module'] for row in rows if row['import time (s)'] > max_seconds]
+        if slow:
+            raise SystemExit(f'Import time of {slow} is above {max_seconds} seconds')
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
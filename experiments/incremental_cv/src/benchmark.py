@@ -0,0 +1,35 @@
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import ETS, AutoARIMA, SimpleExponentialSmoothingOptimized
+from statsforecast.utils import generate_series
+
+
+def main(n_series: int = 1_000, n_ets: int = 20, n_arima: int = 5, h: int = 7, n_windows: int = 20) -> None:
+    series = generate_series(n_series, freq='D', min_length=200, max_length=300)
+    models = {
+        'SESOpt': (series, [SimpleExponentialSmoothingOptimized()]),
+        'ETS': (series.loc[series.index < n_ets], [ETS(season_length=7)]),
+        'AutoARIMA': (series.loc[series.index < n_arima], [AutoARIMA(season_length=7)]),
+    }
+    rows = []
+    for name, (df, models_) in models.items():
+        sf = StatsForecast(models=models_, freq='D')
+        # the first call compiles the kernels
+        sf.cross_validation(h=h, df=df.loc[[0]], n_windows=2)
+        for refit in [True, 5, False]:
+            init = perf_counter()
+            res = sf.cross_validation(h=h, df=df, n_windows=n_windows, refit=refit)
+            elapsed = perf_counter() - init
+            mae = np.abs(res['y'] - res[repr(models_[0])]).mean()
+            rows.append({'model': name, 'refit': refit, 'time (s)': elapsed, 'MAE': mae})
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.3f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
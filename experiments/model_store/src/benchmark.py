@@ -0,0 +1,71 @@
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import ModelStore, StatsForecast
+from statsforecast.models import ETS, AutoARIMA, Naive, SimpleExponentialSmoothingOptimized
+from statsforecast.utils import generate_series
+
+
+def dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.iterdir())
+
+
+def run(name: str, models, n_series: int, n_subset: int, h: int) -> dict:
+    series = generate_series(n_series, freq='D', equal_ends=True)
+    sf = StatsForecast(models=models, freq='D').fit(series)
+    ids = np.random.default_rng(0).choice(sf.uids, size=n_subset, replace=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        pkl_path = tmpdir / 'fitted.pkl'
+        init = perf_counter()
+        with open(pkl_path, 'wb') as f:
+            pickle.dump(sf.fitted_, f)
+        pkl_save = perf_counter() - init
+        # a service with the pickle has to load every model before predicting
+        init = perf_counter()
+        with open(pkl_path, 'rb') as f:
+            pickle.load(f)
+        pkl_load = perf_counter() - init
+        store_path = tmpdir / 'store'
+        init = perf_counter()
+        sf.save(store_path)
+        store_save = perf_counter() - init
+        init = perf_counter()
+        store = ModelStore(store_path)
+        store_load = perf_counter() - init
+        # the kernels of the models are compiled by the first call
+        store.predict(h=h, ids=ids[:1])
+        init = perf_counter()
+        store.predict(h=h, ids=ids)
+        store_predict = perf_counter() - init
+        return {
+            'models': f'{name} ({n_series:,} series)',
+            'pickle size (MB)': os.path.getsize(pkl_path) / 2**20,
+            'store size (MB)': dir_size(store_path) / 2**20,
+            'pickle save (s)': pkl_save,
+            'store save (s)': store_save,
+            'pickle load (s)': pkl_load,
+            'store open (s)': store_load,
+            f'store predict {n_subset} (s)': store_predict,
+        }
+
+
+def main(n_series: int = 20_000, n_arima: int = 500, n_subset: int = 100, h: int = 7) -> None:
+    rows = [
+        run('Naive, SESOpt, ETS', [Naive(), SimpleExponentialSmoothingOptimized(), ETS(model='ZZN')], n_series, n_subset, h),
+        run('AutoARIMA', [AutoARIMA(season_length=7)], n_arima, n_subset, h),
+    ]
+    df = pd.DataFrame(rows).set_index('models').T
+    print(tabulate(df, headers='keys', tablefmt='pipe', floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
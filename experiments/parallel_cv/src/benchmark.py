@@ -0,0 +1,57 @@
+import heapq
+from time import perf_counter
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import SimpleExponentialSmoothingOptimized
+from statsforecast.utils import generate_series
+
+
+def task_times(sf, tasks, h, test_size):
+    # time of each task computed alone, as a worker would
+    times = []
+    for (start, end), window_range in tasks:
+        init = perf_counter()
+        sf.ga.view(start, end).cross_validation(sf.models, h, test_size, window_range=window_range)
+        times.append(perf_counter() - init)
+    return times
+
+
+def makespan(times, n_jobs):
+    # the pool hands the tasks in order to the first worker that is free
+    workers = [0.0] * n_jobs
+    for t in times:
+        heapq.heappush(workers, heapq.heappop(workers) + t)
+    return max(workers)
+
+
+def main(n_series: int = 4, length: int = 20_000, h: int = 7, n_windows: int = 200, n_jobs: int = 8) -> None:
+    series = generate_series(n_series, freq='D', min_length=length, max_length=length)
+    models = [SimpleExponentialSmoothingOptimized()]
+    sf = StatsForecast(models=models, freq='D', n_jobs=n_jobs)
+    sf._prepare_fit(series, sort_df=True)
+    test_size = h + n_windows - 1
+    # the first call compiles the kernels
+    sf.ga.view(0, 1).cross_validation(models, h, test_size, window_range=(0, 1))
+    # splitting only the series the jobs are limited by the number of series
+    splits = {'series': (sf.n_jobs, [(series_range, None) for series_range in sf._chunk_ranges()])}
+    sf.n_jobs = min(n_jobs, n_series * n_windows)
+    splits['series x windows'] = (sf.n_jobs, sf._cv_chunk_ranges(n_windows))
+    rows = []
+    for name, (jobs, tasks) in splits.items():
+        times = task_times(sf, tasks, h, test_size)
+        rows.append({
+            'split': name,
+            'jobs': jobs,
+            'tasks': len(tasks),
+            'total time (s)': sum(times),
+            'estimated time (s)': makespan(times, jobs),
+        })
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
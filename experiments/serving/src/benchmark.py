@@ -0,0 +1,67 @@
+import asyncio
+from time import perf_counter
+
+import fire
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from statsforecast import StatsForecast
+from statsforecast.models import Naive, SeasonalNaive, SimpleExponentialSmoothingOptimized
+from statsforecast.serving import ForecastServer
+from statsforecast.utils import generate_series
+
+
+async def clients(server: ForecastServer, uids: np.ndarray, n_clients: int, n_requests: int, n_ids: int, h: int):
+    # each client sends its requests one after the other
+    rng = np.random.default_rng(0)
+    latencies = []
+
+    async def client():
+        for _ in range(n_requests // n_clients):
+            ids = rng.choice(uids, size=n_ids, replace=False).tolist()
+            init = perf_counter()
+            await server.forecast(ids=ids, h=h)
+            latencies.append(perf_counter() - init)
+
+    init = perf_counter()
+    await asyncio.gather(*[client() for _ in range(n_clients)])
+    return perf_counter() - init, np.array(latencies)
+
+
+async def run(sf: StatsForecast, max_wait: float, max_batch_size: int, **kwargs) -> dict:
+    async with ForecastServer(sf, max_batch_size=max_batch_size, max_wait=max_wait) as server:
+        # the first batch compiles the kernels of the models
+        await server.forecast(ids=sf.uids[:1].tolist(), h=kwargs['h'])
+        server.n_batches = 0
+        total, latencies = await clients(server, sf.uids.to_numpy(), **kwargs)
+    return {
+        'max_wait (ms)': 1_000 * max_wait,
+        'requests/s': latencies.size / total,
+        'p50 latency (ms)': 1_000 * np.quantile(latencies, 0.5),
+        'p99 latency (ms)': 1_000 * np.quantile(latencies, 0.99),
+        'series per batch': kwargs['n_ids'] * latencies.size / server.n_batches,
+    }
+
+
+def main(
+        n_series: int = 10_000,
+        n_clients: int = 64,
+        n_requests: int = 6_400,
+        n_ids: int = 3,
+        h: int = 7,
+        max_batch_size: int = 1_024,
+    ) -> None:
+    series = generate_series(n_series, equal_ends=True)
+    models = [Naive(), SeasonalNaive(season_length=7), SimpleExponentialSmoothingOptimized()]
+    sf = StatsForecast(models=models, freq='D').fit(series)
+    rows = []
+    for max_wait in (0, 0.001, 0.005):
+        rows.append(asyncio.run(run(
+            sf, max_wait, max_batch_size, n_clients=n_clients, n_requests=n_requests, n_ids=n_ids, h=h,
+        )))
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import fire
+import pandas as pd
+from tabulate import tabulate
+
+# fit and predict of a fresh python process
+SCRIPT = """
+import gc
+import os
+import pickle
+import resource
+from time import perf_counter
+
+from statsforecast import StatsForecast
+from statsforecast.models import (
+    HistoricAverage, Naive, RandomWalkWithDrift, SeasonalNaive, SimpleExponentialSmoothingOptimized,
+)
+from statsforecast.utils import generate_series
+
+def rss():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+models = [
+    Naive(), SeasonalNaive(season_length=7), SimpleExponentialSmoothingOptimized(),
+    HistoricAverage(), RandomWalkWithDrift(),
+]
+series = generate_series({n_series}, min_length={min_length}, max_length={max_length})
+sf = StatsForecast(df=series, models=models, freq='D', keep_fitted='{keep_fitted}', n_jobs={n_jobs})
+del series
+gc.collect()
+rss_before = rss()
+init = perf_counter()
+sf.fit()
+fit_time = perf_counter() - init
+gc.collect()
+rss_models = rss() - rss_before
+init = perf_counter()
+payload = pickle.dumps(sf.fitted_, protocol=pickle.HIGHEST_PROTOCOL)
+pickle_time = perf_counter() - init
+pickle_size = len(payload) / 2**20
+del payload
+# the first call starts the workers and compiles the kernels
+sf.predict(h=7)
+init = perf_counter()
+sf.predict(h=7)
+predict_time = perf_counter() - init
+sf.close()
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+print(fit_time, rss_models, peak, pickle_size, pickle_time, predict_time)
+"""
+
+
+def run(keep_fitted: str, n_series: int, min_length: int, max_length: int, n_jobs: int) -> dict:
+    script = SCRIPT.format(
+        n_series=n_series, min_length=min_length, max_length=max_length, keep_fitted=keep_fitted, n_jobs=n_jobs,
+    )
+    out = subprocess.run([sys.executable, '-c', script], capture_output=True, check=True, text=True)
+    fit_time, rss_models, peak, pickle_size, pickle_time, predict_time = map(float, out.stdout.split())
+    return {
+        'keep_fitted': keep_fitted,
+        'fit (s)': fit_time,
+        'RSS of the models (MB)': rss_models,
+        'peak RSS (MB)': peak,
+        'pickle size (MB)': pickle_size,
+        'pickle (s)': pickle_time,
+        f'predict n_jobs={n_jobs} (s)': predict_time,
+    }
+
+
+def main(n_series: int = 100_000, min_length: int = 100, max_length: int = 300, n_jobs: int = 2) -> None:
+    rows = [run(keep_fitted, n_series, min_length, max_length, n_jobs) for keep_fitted in ('all', 'minimal')]
+    print(tabulate(pd.DataFrame(rows), headers='keys', tablefmt='pipe', showindex=False, floatfmt=',.2f'))
+
+
+if __name__ == '__main__':
+    fire.Fire(main)
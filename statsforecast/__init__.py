@@ -1,3 +1,3 @@
 __version__ = "1.0.0"
-__all__ = ['StatsForecast']
-from .core import StatsForecast
+__all__ = ['StatsForecast', 'ModelStore', 'warmup']
+from .core import ModelStore, StatsForecast, warmup
@@ -1,11 +1,12 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/arima.ipynb.
 
 # %% auto 0
-__all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'auto_arima_f', 'print_statsforecast_ARIMA',
-           'ARIMASummary', 'AutoARIMA']
+__all__ = ['predict_arima', 'arima_string', 'forecast_arima', 'fitted_arima', 'arima_update', 'auto_arima_f',
+           'print_statsforecast_ARIMA', 'ARIMASummary', 'AutoARIMA']
 
 # %% ../nbs/arima.ipynb 3
 import math
+import os
 import warnings
 from collections import namedtuple
 from functools import partial
@@ -13,16 +14,17 @@ from typing import Optional, Dict, Union, Tuple
 
 import numpy as np
 import pandas as pd
-import statsmodels.api as sm
 from numba import njit
-from scipy.optimize import minimize
-from scipy.stats import norm
 
 # %% ../nbs/arima.ipynb 4
-OptimResult = namedtuple("OptimResult", "success status x fun hess_inv")
+# the compiled kernels are cached on disk with NUMBA_CACHE=true
+CACHE = os.environ.get("NUMBA_CACHE", "False").lower() in ["true"]
 
 # %% ../nbs/arima.ipynb 5
-@njit
+OptimResult = namedtuple("OptimResult", "success status x fun hess_inv")
+
+# %% ../nbs/arima.ipynb 6
+@njit(nogil=True, cache=CACHE)
 def partrans(p, raw, new):
     if p > 100:
         raise ValueError("can only transform 100 pars in arima0")
@@ -36,8 +38,8 @@ def partrans(p, raw, new):
             work[k] -= a * new[j - k - 1]
         new[:j] = work[:j]
 
-# %% ../nbs/arima.ipynb 6
-@njit
+# %% ../nbs/arima.ipynb 7
+@njit(nogil=True, cache=CACHE)
 def arima_gradtrans(x, arma):
     eps = 1e-3
     mp, mq, msp = arma[:3]
@@ -68,8 +70,8 @@ def arima_gradtrans(x, arma):
             w1[i] -= eps
     return y
 
-# %% ../nbs/arima.ipynb 8
-@njit
+# %% ../nbs/arima.ipynb 9
+@njit(nogil=True, cache=CACHE)
 def arima_undopars(x, arma):
     mp, mq, msp = arma[:3]
     res = x.copy()
@@ -80,8 +82,8 @@ def arima_undopars(x, arma):
         partrans(msp, x[v:], res[v:])
     return res
 
-# %% ../nbs/arima.ipynb 10
-@njit
+# %% ../nbs/arima.ipynb 11
+@njit(nogil=True, cache=CACHE)
 def tsconv(a, b):
     na = len(a)
     nb = len(b)
@@ -95,8 +97,8 @@ def tsconv(a, b):
 
     return ab
 
-# %% ../nbs/arima.ipynb 12
-@njit
+# %% ../nbs/arima.ipynb 13
+@njit(nogil=True, cache=CACHE)
 def inclu2(np_, xnext, xrow, ynext, d, rbar, thetab):
     for i in range(np_):
         xrow[i] = xnext[i]
@@ -124,8 +126,8 @@ def inclu2(np_, xnext, xrow, ynext, d, rbar, thetab):
         else:
             ithisr = ithisr + np_ - i - 1
 
-# %% ../nbs/arima.ipynb 13
-@njit
+# %% ../nbs/arima.ipynb 14
+@njit(nogil=True, cache=CACHE)
 def invpartrans(p, phi, new):
     if p > 100:
         raise ValueError("can only transform 100 pars in arima0")
@@ -142,8 +144,8 @@ def invpartrans(p, phi, new):
     for j in range(p):
         new[j] = math.atanh(new[j])
 
-# %% ../nbs/arima.ipynb 14
-@njit
+# %% ../nbs/arima.ipynb 15
+@njit(nogil=True, cache=CACHE)
 def ARIMA_invtrans(x, arma):
     mp, mq, msp = arma[:3]
     y = x.copy()
@@ -154,8 +156,8 @@ def ARIMA_invtrans(x, arma):
         invpartrans(msp, x[v:], y[v:])
     return y
 
-# %% ../nbs/arima.ipynb 16
-@njit
+# %% ../nbs/arima.ipynb 17
+@njit(nogil=True, cache=CACHE)
 def getQ0(phi, theta):
     p = len(phi)
     q = len(theta)
@@ -284,8 +286,8 @@ def getQ0(phi, theta):
     res = res.reshape((r, r))
     return res
 
-# %% ../nbs/arima.ipynb 18
-@njit
+# %% ../nbs/arima.ipynb 19
+@njit(nogil=True, cache=CACHE)
 def arima_transpar(params_in, arma, trans):
     # TODO check trans=True results
     mp, mq, msp, msq, ns = arma[:5]
@@ -323,8 +325,8 @@ def arima_transpar(params_in, arma, trans):
 
     return phi, theta
 
-# %% ../nbs/arima.ipynb 21
-@njit
+# %% ../nbs/arima.ipynb 22
+@njit(nogil=True, cache=CACHE)
 def arima_css(y, arma, phi, theta, ncond):
     n = len(y)
     p = len(phi)
@@ -367,8 +369,8 @@ def arima_css(y, arma, phi, theta, ncond):
 
     return res, resid
 
-# %% ../nbs/arima.ipynb 23
-@njit
+# %% ../nbs/arima.ipynb 24
+@njit(nogil=True, cache=CACHE)
 def _make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(float).eps):
     # check nas phi
     # check nas theta
@@ -420,8 +422,8 @@ def make_arima(phi, theta, delta, kappa=1e6, tol=np.finfo(np.float64).eps):
     res = _make_arima(phi, theta, delta, kappa, tol)
     return dict(zip(keys, res))
 
-# %% ../nbs/arima.ipynb 25
-@njit
+# %% ../nbs/arima.ipynb 26
+@njit(nogil=True, cache=CACHE)
 def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
     n = len(y)
     rd = len(a)
@@ -557,8 +559,8 @@ def arima_like(y, phi, theta, delta, a, P, Pn, up, use_resid):
         rsResid = None
     return ssq, sumlog, nu, rsResid
 
-# %% ../nbs/arima.ipynb 27
-@njit
+# %% ../nbs/arima.ipynb 28
+@njit(nogil=True, cache=CACHE)
 def diff1d(x, lag, differences):
     y = x.copy()
     for _ in range(differences):
@@ -570,7 +572,7 @@ def diff1d(x, lag, differences):
     return y
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def diff2d(x, lag, differences):
     y = np.empty_like(x)
     for j in range(x.shape[1]):
@@ -589,7 +591,7 @@ def diff(x, lag, differences):
         raise ValueError(x.ndim)
     return y[~nan_mask]
 
-# %% ../nbs/arima.ipynb 28
+# %% ../nbs/arima.ipynb 29
 def arima(
     x: np.ndarray,
     order=(0, 0, 0),
@@ -606,6 +608,9 @@ def arima(
     tol=1e-8,
     optim_control={"maxiter": 100},
 ):
+    from scipy.optimize import minimize
+    from statsmodels.regression.linear_model import OLS
+
     SSG = SSinit == "Gardner1980"
     x = x.copy()
 
@@ -815,7 +820,7 @@ def arima(
             dx = diff(dx, seasonal["period"], seasonal["order"][1])
             dxreg = diff(dxreg, seasonal["period"], seasonal["order"][1])
         if len(dx) > dxreg.shape[1]:
-            model = sm.OLS(dx, dxreg)
+            model = OLS(dx, dxreg)
             result = model.fit()
             fit = {"coefs": result.params, "stderrs": result.bse}
         else:
@@ -835,6 +840,7 @@ def arima(
         nan_mask = np.isnan(init)
         if nan_mask.any():
             init[nan_mask] = init0[nan_mask]
+        css_init = init[mask]
         if method == "ML":
             # check stationarity
             if arma[0] > 0:
@@ -847,6 +853,7 @@ def arima(
                     init = ARIMA_invtrans(init, arma)
     else:
         init = init0
+        css_init = init0
 
     def arma_css_op(p, x):
         x = x.copy()
@@ -871,7 +878,7 @@ def arima(
         else:
             res = minimize(
                 arma_css_op,
-                init0,
+                css_init,
                 args=(x,),
                 method=optim_method,
                 tol=tol,
@@ -1028,8 +1035,8 @@ def arima(
     }
     return ans
 
-# %% ../nbs/arima.ipynb 35
-@njit
+# %% ../nbs/arima.ipynb 36
+@njit(nogil=True, cache=CACHE)
 def kalman_forecast(n, Z, a, P, T, V, h):
     p = len(a)
 
@@ -1070,13 +1077,13 @@ def kalman_forecast(n, Z, a, P, T, V, h):
 
     return forecasts, se
 
-# %% ../nbs/arima.ipynb 38
+# %% ../nbs/arima.ipynb 39
 def checkarima(obj):
     if obj["var_coef"] is None:
         return False
     return any(np.isnan(np.sqrt(np.diag(obj["var_coef"]))))
 
-# %% ../nbs/arima.ipynb 39
+# %% ../nbs/arima.ipynb 40
 def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     myNCOL = lambda x: x.shape[1] if x is not None else 0
@@ -1135,7 +1142,7 @@ def predict_arima(model, n_ahead, newxreg=None, se_fit=True):
 
     return pred
 
-# %% ../nbs/arima.ipynb 43
+# %% ../nbs/arima.ipynb 44
 def convert_coef_name(name, inverse=False):
     if not inverse:
         if "ex" in name:
@@ -1157,13 +1164,13 @@ def convert_coef_name(name, inverse=False):
         else:
             return name
 
-# %% ../nbs/arima.ipynb 44
+# %% ../nbs/arima.ipynb 45
 def change_drift_name(model_coef, inverse=False):
     return {
         convert_coef_name(name, inverse): value for name, value in model_coef.items()
     }
 
-# %% ../nbs/arima.ipynb 45
+# %% ../nbs/arima.ipynb 46
 def myarima(
     x,
     order=(0, 0, 0),
@@ -1175,6 +1182,7 @@ def myarima(
     offset=0,
     xreg=None,
     method=None,
+    init=None,
     **kwargs,
 ):
     missing = np.isnan(x)
@@ -1199,17 +1207,25 @@ def myarima(
             else:
                 xreg = drift
             if use_season:
-                fit = arima(x, order, seasonal, xreg, method=method)
+                fit = arima(x, order, seasonal, xreg, method=method, init=init)
             else:
-                fit = arima(x, order, xreg=xreg, method=method)
+                fit = arima(x, order, xreg=xreg, method=method, init=init)
             fit["coef"] = change_drift_name(fit["coef"])
         else:
             if use_season:
                 fit = arima(
-                    x, order, seasonal, include_mean=constant, method=method, xreg=xreg
+                    x,
+                    order,
+                    seasonal,
+                    include_mean=constant,
+                    method=method,
+                    xreg=xreg,
+                    init=init,
                 )
             else:
-                fit = arima(x, order, include_mean=constant, method=method, xreg=xreg)
+                fit = arima(
+                    x, order, include_mean=constant, method=method, xreg=xreg, init=init
+                )
         # nxreg = 0 if xreg is None else xreg.shape[1]
         nstar = n - order[1] - seas_order[1] * m
         if diffs == 1 and constant:
@@ -1259,7 +1275,7 @@ def myarima(
         raise e
         return {"ic": math.inf}
 
-# %% ../nbs/arima.ipynb 48
+# %% ../nbs/arima.ipynb 49
 def search_arima(
     x,
     d=0,
@@ -1307,7 +1323,7 @@ def search_arima(
         raise NotImplementedError("parallel=True")
     return best_fit
 
-# %% ../nbs/arima.ipynb 50
+# %% ../nbs/arima.ipynb 51
 def Arima(
     x,
     order=(0, 0, 0),
@@ -1394,7 +1410,7 @@ def Arima(
         tmp["sigma2"] = np.sum(tmp["residuals"] ** 2) / (nstar - npar + 1)
     return tmp
 
-# %% ../nbs/arima.ipynb 54
+# %% ../nbs/arima.ipynb 55
 def arima_string(model, padding=False):
     order = tuple(model["arma"][i] for i in [0, 5, 1, 2, 6, 3, 4])
     m = order[6]
@@ -1424,11 +1440,11 @@ def arima_string(model, padding=False):
 
     return result
 
-# %% ../nbs/arima.ipynb 57
+# %% ../nbs/arima.ipynb 58
 def is_constant(x):
     return np.all(x[0] == x)
 
-# %% ../nbs/arima.ipynb 58
+# %% ../nbs/arima.ipynb 59
 def forecast_arima(
     model,
     h=None,
@@ -1440,6 +1456,8 @@ def forecast_arima(
     npaths=5_000,
     biasadj=None,
 ):
+    from scipy.stats import norm
+
     if h is None:
         h = 2 * model["arma"][4] if model["arma"][4] > 1 else 10
     if blambda is None:
@@ -1447,6 +1465,11 @@ def forecast_arima(
 
     use_drift = "drift" in model["coef"].keys()
     x = model["x"]
+    if x is None:
+        # compact models keep the size of the serie and its value if it was constant
+        n, x_constant = model["x_size"], model["x_constant"]
+    else:
+        n, x_constant = len(x), x[0] if is_constant(x) else None
     usexreg = use_drift or (model["xreg"] is not None)
     if (xreg is not None) and usexreg:
         if xreg.dtype not in (np.float32, np.float64):
@@ -1466,7 +1489,6 @@ def forecast_arima(
         level = np.arange(51, 100, 3)
 
     if use_drift:
-        n = len(x)
         drift = np.arange(1, h + 1, dtype=np.float64).reshape(-1, 1)
         drift += n
         if xreg is not None:
@@ -1475,8 +1497,8 @@ def forecast_arima(
             xreg = drift
         model["coef"] = change_drift_name(model["coef"], inverse=True)
 
-    if is_constant(x):
-        pred = np.repeat(x[0], h)
+    if x_constant is not None:
+        pred = np.repeat(x_constant, h)
         se = np.repeat(0, h)
     elif usexreg:
         if xreg is None:
@@ -1518,12 +1540,12 @@ def forecast_arima(
         "x": x,
         "series": None,
         "fitted": None,
-        "residuals": model["residuals"],
+        "residuals": model.get("residuals"),
     }
 
     return ans
 
-# %% ../nbs/arima.ipynb 64
+# %% ../nbs/arima.ipynb 65
 def fitted_arima(model, h=1):
     """Returns h-step forecasts for the data used in fitting the model."""
     if h == 1:
@@ -1539,8 +1561,137 @@ def fitted_arima(model, h=1):
     else:
         raise NotImplementedError("h > 1")
 
-# %% ../nbs/arima.ipynb 68
+# %% ../nbs/arima.ipynb 66
+def arima_update(model, y, xreg=None):
+    """Filters new observations with the fitted coefficients of the model."""
+    if model.get("lambda") is not None:
+        raise NotImplementedError("lambda not None")
+    y = np.asarray(y, dtype=np.float64)
+    n = len(model["x"])
+    arma = model["arma"]
+    coef = np.array(list(model["coef"].values()), dtype=np.float64)
+    narma = sum(arma[:4])
+    # regressors in the order of the coefficients: intercept, drift and exogenous
+    regs = []
+    if "drift" in model["coef"]:
+        regs.append(np.arange(n + 1, n + len(y) + 1, dtype=np.float64).reshape(-1, 1))
+    if xreg is not None:
+        regs.append(np.asarray(xreg, dtype=np.float64).reshape(len(y), -1))
+    newxreg = np.concatenate(regs, axis=1) if regs else None
+    if len(coef) > narma:
+        if list(model["coef"].keys())[narma] == "intercept":
+            intercept = np.ones((len(y), 1))
+            fullxreg = (
+                intercept
+                if newxreg is None
+                else np.concatenate([intercept, newxreg], axis=1)
+            )
+        else:
+            fullxreg = newxreg
+        y_adj = y - np.dot(fullxreg, coef[narma:])
+    else:
+        y_adj = y
+    # the state of the kalman filter is updated in place
+    mod = {
+        **model["model"],
+        "a": model["model"]["a"].copy(),
+        "P": model["model"]["P"].copy(),
+        "Pn": model["model"]["Pn"].copy(),
+    }
+    _, _, _, resid = arima_like(
+        y_adj,
+        mod["phi"],
+        mod["theta"],
+        mod["delta"],
+        mod["a"],
+        mod["P"],
+        mod["Pn"],
+        0,
+        True,
+    )
+    updated = {
+        **model,
+        "model": mod,
+        "x": np.hstack([model["x"], y]),
+        "residuals": np.hstack([model["residuals"], resid]),
+        "fitted": None,
+        "nobs": model["nobs"] + len(y),
+    }
+    if model["xreg"] is not None:
+        updated["xreg"] = np.concatenate([model["xreg"], newxreg], axis=0)
+    return updated
+
+# %% ../nbs/arima.ipynb 71
+def arima_to_arrays(model):
+    # the parts of the model used by forecast_arima as flat arrays
+    arma = model["arma"]
+    # flags of the intercept and drift terms that go before the exogenous ones
+    mean_terms = int("intercept" in model["coef"]) + 2 * int("drift" in model["coef"])
+    if model["x"] is None:
+        x_size, x_constant = model["x_size"], model["x_constant"]
+    else:
+        x = model["x"]
+        x_size, x_constant = len(x), x[0] if is_constant(x) else None
+    mod = model["model"]
+    return {
+        "coef": np.array(list(model["coef"].values()), dtype=np.float64),
+        "arma": np.array(arma, dtype=np.int32),
+        "mean_terms": np.array([mean_terms], dtype=np.int8),
+        "n_xreg": np.array(
+            [-1 if model["xreg"] is None else model["xreg"].shape[1]], dtype=np.int32
+        ),
+        "x_size": np.array([x_size], dtype=np.int64),
+        "x_constant": np.array([np.nan if x_constant is None else x_constant]),
+        "sigma2": np.array([model["sigma2"]], dtype=np.float64),
+        **{
+            var: np.ravel(mod[var]).astype(np.float64)
+            for var in ["Z", "a", "P", "T", "V", "h"]
+        },
+    }
+
+
+def arima_from_arrays(arrays):
+    # inverse of arima_to_arrays, the model can only be used for forecasting
+    arma = tuple(int(v) for v in arrays["arma"])
+    names = (
+        [f"ar{i + 1}" for i in range(arma[0])]
+        + [f"ma{i + 1}" for i in range(arma[1])]
+        + [f"sar{i + 1}" for i in range(arma[2])]
+        + [f"sma{i + 1}" for i in range(arma[3])]
+    )
+    mean_terms = int(arrays["mean_terms"][0])
+    if mean_terms & 1:
+        names.append("intercept")
+    if mean_terms & 2:
+        names.append("drift")
+    coef = arrays["coef"]
+    names += [f"ex_{i + 1}" for i in range(coef.size - len(names))]
+    n_xreg = int(arrays["n_xreg"][0])
+    x_constant = float(arrays["x_constant"][0])
+    rd = arrays["a"].size
+    return {
+        "coef": dict(zip(names, coef.tolist())),
+        "arma": arma,
+        "sigma2": float(arrays["sigma2"][0]),
+        "lambda": None,
+        "x": None,
+        "x_size": int(arrays["x_size"][0]),
+        "x_constant": None if np.isnan(x_constant) else x_constant,
+        "xreg": None if n_xreg < 0 else np.empty((0, n_xreg)),
+        "model": {
+            "Z": np.array(arrays["Z"]),
+            "a": np.array(arrays["a"]),
+            "P": np.array(arrays["P"]).reshape(rd, rd),
+            "T": np.array(arrays["T"]).reshape(rd, rd),
+            "V": np.array(arrays["V"]).reshape(rd, rd),
+            "h": float(arrays["h"][0]),
+        },
+    }
+
+# %% ../nbs/arima.ipynb 73
 def mstl(x, period, blambda=None, s_window=7 + 4 * np.arange(1, 7)):
+    from statsmodels.tsa.seasonal import STL
+
     origx = x
     n = len(x)
     msts = period
@@ -1553,7 +1704,7 @@ def mstl(x, period, blambda=None, s_window=7 + 4 * np.arange(1, 7)):
         ...  # boxcox
     # tt = np.arange(n)
     if msts > 1:
-        fit = sm.tsa.STL(x, period=msts, seasonal=s_window[0]).fit()
+        fit = STL(x, period=msts, seasonal=s_window[0]).fit()
         seas = fit.seasonal
         deseas = x - seas
         trend = fit.trend
@@ -1575,7 +1726,7 @@ def mstl(x, period, blambda=None, s_window=7 + 4 * np.arange(1, 7)):
     output["remainder"] = remainder
     return pd.DataFrame(output)
 
-# %% ../nbs/arima.ipynb 70
+# %% ../nbs/arima.ipynb 75
 def seas_heuristic(x, period):
     # nperiods = period > 1
     season = math.nan
@@ -1587,7 +1738,7 @@ def seas_heuristic(x, period):
         season = max(0, min(1, 1 - vare / np.var(remainder + seasonal, ddof=1)))
     return season
 
-# %% ../nbs/arima.ipynb 72
+# %% ../nbs/arima.ipynb 77
 def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
     D = 0
     if alpha < 0.01:
@@ -1650,8 +1801,10 @@ def nsdiffs(x, test="seas", alpha=0.05, period=1, max_D=1, **kwargs):
             dodiff = False
     return D
 
-# %% ../nbs/arima.ipynb 74
+# %% ../nbs/arima.ipynb 79
 def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
+    from statsmodels.tsa.stattools import kpss
+
     x = x[~np.isnan(x)]
     d = 0
     if alpha < 0.01:
@@ -1672,7 +1825,7 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             with warnings.catch_warnings():
                 warnings.simplefilter("ignore")
                 nlags = math.floor(3 * math.sqrt(len(x)) / 13)
-                diff = sm.tsa.kpss(x, "c", nlags=nlags)[1] < alpha
+                diff = kpss(x, "c", nlags=nlags)[1] < alpha
         except Exception as e:
             warnings.warn(
                 f"The chosen unit root test encountered an error when testing for the {d} difference.\n"
@@ -1695,13 +1848,30 @@ def ndiffs(x, alpha=0.05, test="kpss", kind="level", max_d=2):
             return d - 1
     return d
 
-# %% ../nbs/arima.ipynb 76
+# %% ../nbs/arima.ipynb 81
 def newmodel(p, d, q, P, D, Q, constant, results):
     curr = np.array([p, d, q, P, D, Q, constant])
     in_results = (curr == results[:, :7]).all(1).any()
     return not in_results
 
-# %% ../nbs/arima.ipynb 78
+
+def warm_start_coef(model, order, seasonal_order, constant, xreg):
+    # starting values from the coefficients of a previous fit, the lags
+    # it didn't have start at zero and the regression is estimated again
+    if model is None:
+        return None
+    names = (
+        [f"ar{i + 1}" for i in range(order[0])]
+        + [f"ma{i + 1}" for i in range(order[2])]
+        + [f"sar{i + 1}" for i in range(seasonal_order[0])]
+        + [f"sma{i + 1}" for i in range(seasonal_order[2])]
+    )
+    if not names:
+        return None
+    nxreg = int(constant) + (0 if xreg is None else xreg.shape[1])
+    return np.array([model["coef"].get(name, 0.0) for name in names] + [np.nan] * nxreg)
+
+# %% ../nbs/arima.ipynb 83
 def auto_arima_f(
     x,
     d=None,
@@ -1738,7 +1908,11 @@ def auto_arima_f(
     parallel=False,
     num_cores=2,
     period=1,
+    warm_start=None,
 ):
+    from statsmodels.regression.linear_model import OLS
+    from statsmodels.tools.tools import add_constant
+
     if approximation is None:
         approximation = len(x) > 150 or period > 12
     if stepwise and parallel:
@@ -1807,10 +1981,16 @@ def auto_arima_f(
             if sv.min() / sv.sum() < np.finfo(np.float64).eps:
                 raise ValueError("xreg is rank deficient")
             j = (~np.isnan(x)) & (~np.isnan(np.nansum(xregg, 1)))
-            xx[j] = sm.OLS(x, sm.add_constant(xregg)).fit().resid
+            xx[j] = OLS(x, add_constant(xregg)).fit().resid
     else:
         xx = x
         xregg = None
+    if warm_start is not None:
+        # the differences of a previous fit replace the unit root tests
+        if d is None:
+            d = warm_start["arma"][5]
+        if D is None and warm_start["arma"][4] == m:
+            D = warm_start["arma"][6]
     if stationary:
         d = D = 0
     if m == 1:
@@ -1971,9 +2151,34 @@ def auto_arima_f(
     q = start_q = min(start_q, max_q)
     P = start_P = min(start_P, max_P)
     Q = start_Q = min(start_Q, max_Q)
+    if warm_start is not None:
+        # the search starts from the previous orders and explores their neighbourhood
+        p = min(warm_start["arma"][0], max_p)
+        q = min(warm_start["arma"][1], max_q)
+        P = min(warm_start["arma"][2], max_P)
+        Q = min(warm_start["arma"][3], max_Q)
+        constant = constant and any(
+            c in warm_start["coef"] for c in ("intercept", "drift")
+        )
+
+    def fit_myarima(order, seasonal, **kwargs):
+        init = warm_start_coef(
+            warm_start, order, seasonal["order"], kwargs["constant"], xreg
+        )
+        # the conditional sum of squares fits of the approximation are cheap and
+        # from these starting values they could end outside the invertible region
+        css = kwargs["approximation"] or kwargs["method"] == "CSS"
+        if init is not None and not css:
+            try:
+                return myarima(order=order, seasonal=seasonal, init=init, **kwargs)
+            except ValueError:
+                # the previous coefficients aren't admissible for the new data
+                pass
+        return myarima(order=order, seasonal=seasonal, **kwargs)
+
     results = np.full((nmodels, 8), np.nan)
     p_myarima = partial(
-        myarima,
+        fit_myarima,
         x=x,
         constant=constant,
         ic=ic,
@@ -1988,54 +2193,56 @@ def auto_arima_f(
         seasonal={"order": (P, D, Q), "period": m},
     )
     results[0] = (p, d, q, P, D, Q, constant, bestfit["ic"])
-    fit = p_myarima(
-        order=(0, d, 0),
-        seasonal={"order": (0, D, 0), "period": m},
-    )
-    results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
-    if fit["ic"] < bestfit["ic"]:
-        bestfit = fit
-        p = q = P = Q = 0
-    k = 1
-    if max_p > 0 or max_P > 0:
-        p_ = int(max_p > 0)
-        P_ = int(m > 1 and max_P > 0)
-        fit = p_myarima(
-            order=(p_, d, 0),
-            seasonal={"order": (P_, D, 0), "period": m},
-        )
-        results[k + 1] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = p_
-            P = P_
-            q = Q = 0
-        k += 1
-    if max_q > 0 or max_Q > 0:
-        q_ = int(max_q > 0)
-        Q_ = int(m > 1 and max_Q > 0)
-        fit = p_myarima(
-            order=(0, d, q_),
-            seasonal={"order": (0, D, Q_), "period": m},
-        )
-        results[k + 1] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
-        if fit["ic"] < bestfit["ic"]:
-            bestfit = fit
-            p = P = 0
-            Q = Q_
-            q = q_
-        k += 1
-    if constant:
+    k = 0
+    if warm_start is None:
         fit = p_myarima(
             order=(0, d, 0),
             seasonal={"order": (0, D, 0), "period": m},
-            constant=False,
         )
-        results[k + 1] = (0, d, 0, 0, D, 0, 0, fit["ic"])
+        results[1] = (0, d, 0, 0, D, 0, constant, fit["ic"])
         if fit["ic"] < bestfit["ic"]:
             bestfit = fit
             p = q = P = Q = 0
-        k += 1
+        k = 1
+        if max_p > 0 or max_P > 0:
+            p_ = int(max_p > 0)
+            P_ = int(m > 1 and max_P > 0)
+            fit = p_myarima(
+                order=(p_, d, 0),
+                seasonal={"order": (P_, D, 0), "period": m},
+            )
+            results[k + 1] = (p_, d, 0, P_, D, 0, constant, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = p_
+                P = P_
+                q = Q = 0
+            k += 1
+        if max_q > 0 or max_Q > 0:
+            q_ = int(max_q > 0)
+            Q_ = int(m > 1 and max_Q > 0)
+            fit = p_myarima(
+                order=(0, d, q_),
+                seasonal={"order": (0, D, Q_), "period": m},
+            )
+            results[k + 1] = (0, d, q_, 0, D, Q_, constant, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = P = 0
+                Q = Q_
+                q = q_
+            k += 1
+        if constant:
+            fit = p_myarima(
+                order=(0, d, 0),
+                seasonal={"order": (0, D, 0), "period": m},
+                constant=False,
+            )
+            results[k + 1] = (0, d, 0, 0, D, 0, 0, fit["ic"])
+            if fit["ic"] < bestfit["ic"]:
+                bestfit = fit
+                p = q = P = Q = 0
+            k += 1
 
     def try_params(p, d, q, P, D, Q, constant, k, bestfit):
         k += 1
@@ -2052,7 +2259,8 @@ def auto_arima_f(
             improved = True
         return k, bestfit, improved
 
-    startk = 0
+    # a warm start begins the loop with a single model in results
+    startk = -1
     while startk < k and k < nmodels:
         startk = k
         if P > 0 and newmodel(p, d, q, P - 1, D, Q, constant, results[:k]):
@@ -2228,10 +2436,10 @@ def auto_arima_f(
         for i in range(nmodels):
             k = icorder[i]
             p, q, P, Q, constant = map(int, results[k, [0, 2, 3, 5, 6]])
-            fit = myarima(
-                x,
-                (p, d, q),
-                {"order": (P, D, Q), "period": m},
+            fit = fit_myarima(
+                x=x,
+                order=(p, d, q),
+                seasonal={"order": (P, D, Q), "period": m},
                 constant=results[k, 6],
                 ic=ic,
                 trace=trace,
@@ -2251,7 +2459,7 @@ def auto_arima_f(
 
     return bestfit
 
-# %% ../nbs/arima.ipynb 85
+# %% ../nbs/arima.ipynb 91
 def print_statsforecast_ARIMA(model, digits=3, se=True):
     print(arima_string(model, padding=False))
     if model["lambda"] is not None:
@@ -2281,7 +2489,7 @@ def print_statsforecast_ARIMA(model, digits=3, se=True):
     if not np.isnan(model["aic"]):
         print(f'AIC={round(model["aic"], 2)}')
 
-# %% ../nbs/arima.ipynb 87
+# %% ../nbs/arima.ipynb 93
 class ARIMASummary:
     """ARIMA Summary."""
 
@@ -2294,7 +2502,7 @@ class ARIMASummary:
     def summary(self):
         return print_statsforecast_ARIMA(self.model)
 
-# %% ../nbs/arima.ipynb 88
+# %% ../nbs/arima.ipynb 94
 class AutoARIMA:
     """An AutoARIMA estimator.
 
@@ -2601,6 +2809,8 @@ class AutoARIMA:
         """
         fitted_values = pd.DataFrame({"mean": fitted_arima(self.model_.model)})
         if level is not None:
+            from scipy.stats import norm
+
             _level = [level] if isinstance(level, int) else level
             _level = sorted(_level)
             arr_level = np.asarray(_level)
@@ -1,13 +1,19 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/core.ipynb.
 
 # %% auto 0
-__all__ = ['StatsForecast']
+__all__ = ['warmup', 'ColumnarResult', 'ModelStore', 'StatsForecast']
 
 # %% ../nbs/core.ipynb 4
 import inspect
 import logging
-from os import cpu_count
-from typing import Any, List, Optional
+import os
+import pickle
+import weakref
+from functools import lru_cache
+from itertools import repeat
+from os import PathLike, cpu_count
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -19,7 +25,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# %% ../nbs/core.ipynb 8
+# %% ../nbs/core.ipynb 9
+# statistics accumulated for each model by the cross validation metrics
+_CV_STATS = ("mae", "rmse", "smape", "mase")
+
+
+def _cv_metric_cols(models, cols, level):
+    # positions in cols of the mean of each model and of the bounds of their intervals,
+    # with the (model, level) of each interval
+    mean_idxs = [cols.index(repr(model)) for model in models]
+    intervals = [
+        (i_model, lv)
+        for i_model, model in enumerate(models)
+        for lv in level
+        if f"{repr(model)}-lo-{lv}" in cols
+    ]
+    lo_idxs = [
+        cols.index(f"{repr(models[i_model])}-lo-{lv}") for i_model, lv in intervals
+    ]
+    hi_idxs = [
+        cols.index(f"{repr(models[i_model])}-hi-{lv}") for i_model, lv in intervals
+    ]
+    return mean_idxs, lo_idxs, hi_idxs, intervals
+
+# %% ../nbs/core.ipynb 10
+@lru_cache(maxsize=None)
+def _has_level(model_cls, attr):
+    return "level" in inspect.signature(getattr(model_cls, attr)).parameters
+
+
+def _output_keys(res):
+    # keys of the outputs of a model in the order of its columns,
+    # computed from the first serie and used for the rest
+    return [key for key in res.keys() if key.startswith(("mean", "lo", "hi"))]
+
+
+def _append_positions(indptr, new_indptr, idxs):
+    # boundaries of the groups after adding the groups of new_indptr at the end of
+    # the groups idxs, and the positions of the current and the new rows
+    sizes = np.diff(indptr)
+    new_sizes = np.zeros_like(sizes)
+    new_sizes[idxs] = np.diff(new_indptr)
+    out_indptr = np.hstack([0, np.cumsum(sizes + new_sizes)]).astype(indptr.dtype)
+    pos = np.arange(indptr[-1]) + np.repeat(np.cumsum(new_sizes) - new_sizes, sizes)
+    new_pos = np.arange(new_indptr[-1]) + np.repeat(
+        out_indptr[idxs] + sizes[idxs] - new_indptr[:-1], np.diff(new_indptr)
+    )
+    return out_indptr, pos, new_pos
+
+
+def _cv_cutoffs(h, test_size, step_size, window_range=None):
+    # periods before the end of the series where each window ends
+    cutoffs = range(-test_size, -h + 1, step_size)
+    if window_range is not None:
+        cutoffs = cutoffs[window_range[0] : window_range[1]]
+    return cutoffs
+
+
+def _cv_block_size(n_windows, refit=True):
+    # consecutive windows that have to be computed together,
+    # the models updated between windows are only fitted at the start of each block
+    return n_windows if refit is False else int(refit)
+
+
+def _segment_rows(offsets, sizes):
+    # rows of consecutive segments of the given sizes
+    # when each one is moved to start at its offset
+    return np.repeat(offsets - (np.cumsum(sizes) - sizes), sizes) + np.arange(
+        sizes.sum()
+    )
+
+
+def _minimal_model(model):
+    # copy of a fitted model with only what predict needs,
+    # the models without the arrays of the model store are kept whole
+    if not hasattr(model, "_to_arrays"):
+        return model
+    return model._from_arrays(model._to_arrays())
+
+
+def _model_cols(model, keys):
+    if keys is None:
+        keys = ["mean"]
+    return [repr(model) if key == "mean" else f"{repr(model)}-{key}" for key in keys]
+
+
 class GroupedArray:
     def __init__(self, data, indptr):
         self.data = data
@@ -37,6 +127,18 @@ class GroupedArray:
             return GroupedArray(new_data, new_indptr)
         raise ValueError(f"idx must be either int or slice, got {type(idx)}")
 
+    def view(self, start, end):
+        # groups [start, end) without copying the data
+        indptr = self.indptr[start : end + 1]
+        return GroupedArray(self.data[indptr[0] : indptr[-1]], indptr - indptr[0])
+
+    @property
+    def dtype(self):
+        # floating point type of the outputs
+        if np.issubdtype(self.data.dtype, np.floating):
+            return self.data.dtype
+        return np.dtype(np.float32)
+
     def __len__(self):
         return self.n_groups
 
@@ -50,40 +152,75 @@ class GroupedArray:
             self.indptr, other.indptr
         )
 
-    def fit(self, models):
+    def fit(self, models, prev_fm=None, keep_fitted="all"):
+        # with prev_fm the models are copies of the fitted ones,
+        # so the models with a warm start begin their search from them.
+        # with keep_fitted='minimal' each model is slimmed right after its fit,
+        # so the full models of all the series are never in memory at once
         fm = np.full((self.n_groups, len(models)), np.nan, dtype=object)
         for i, grp in enumerate(self):
             y = grp[:, 0] if grp.ndim == 2 else grp
             X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
             for i_model, model in enumerate(models):
+                if prev_fm is not None:
+                    model = prev_fm[i, i_model]
                 new_model = model.new()
                 fm[i, i_model] = new_model.fit(y=y, X=X)
+                if keep_fitted == "minimal":
+                    fm[i, i_model] = _minimal_model(fm[i, i_model])
+        return fm
+
+    def update(self, fm, new, idxs):
+        # self already has the observations of new, which belong to the groups idxs.
+        # models without an update method are fitted again on the whole serie
+        for i_new, i in enumerate(idxs):
+            grp = new[i_new]
+            y = grp[:, 0] if grp.ndim == 2 else grp
+            X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+            for i_model in range(fm.shape[1]):
+                model = fm[i, i_model]
+                if hasattr(model, "update"):
+                    fm[i, i_model] = model.update(y=y, X=X)
+                else:
+                    full_grp = self[int(i)]
+                    y_full = full_grp[:, 0] if full_grp.ndim == 2 else full_grp
+                    X_full = (
+                        full_grp[:, 1:]
+                        if (full_grp.ndim == 2 and full_grp.shape[1] > 1)
+                        else None
+                    )
+                    fm[i, i_model] = model.new().fit(y=y_full, X=X_full)
         return fm
 
     def _get_cols(self, models, attr, h, X, level=tuple()):
-        n_models = len(models)
-        cuts = np.full(n_models + 1, fill_value=np.nan, dtype=np.int32)
-        has_level_models = np.full(n_models, fill_value=False, dtype=bool)
-        cuts[0] = 0
-        for i_model, model in enumerate(models):
-            len_cols = 1  # mean
-            has_level = (
-                "level" in inspect.signature(getattr(model, attr)).parameters
-                and len(level) > 0
-            )
-            has_level_models[i_model] = has_level
-            if has_level:
-                len_cols += 2 * len(level)  # levels
-            cuts[i_model + 1] = len_cols + cuts[i_model]
+        # the forecasts of the i-th model go in the columns cuts[i]:cuts[i + 1]
+        has_level_models = np.array(
+            [len(level) > 0 and _has_level(type(model), attr) for model in models],
+            dtype=bool,
+        )
+        cuts = np.cumsum(np.hstack([0, 1 + 2 * len(level) * has_level_models])).astype(
+            np.int32
+        )
         return cuts, has_level_models
 
+    def _panel_models(self, models, has_level_models):
+        # models that can forecast the whole panel in a single call
+        return [
+            hasattr(model, "forecast_panel") and not has_level
+            for model, has_level in zip(models, has_level_models)
+        ]
+
     def _output_fcst(self, models, attr, h, X, level=tuple()):
         # returns empty output according to method
         cuts, has_level_models = self._get_cols(
             models=models, attr=attr, h=h, X=X, level=level
         )
+        # column major so each column of the output is contiguous
         out = np.full(
-            (self.n_groups * h, cuts[-1]), fill_value=np.nan, dtype=np.float32
+            (self.n_groups * h, cuts[-1]),
+            fill_value=np.nan,
+            dtype=self.dtype,
+            order="F",
         )
         return out, cuts, has_level_models
 
@@ -93,39 +230,28 @@ class GroupedArray:
         fcsts, cuts, has_level_models = self._output_fcst(
             models=fm[0], attr="predict", h=h, X=X, level=level
         )
-        matches = ["mean", "lo", "hi"]
         cols = []
         for i_model in range(fm.shape[1]):
-            has_level = has_level_models[i_model]
+            keys = None
             kwargs = {}
-            if has_level:
+            if has_level_models[i_model]:
                 kwargs["level"] = level
-            for i, _ in enumerate(self):
+            for i in range(self.n_groups):
                 if X is not None:
                     X_ = X[i]
                 else:
                     X_ = None
                 res_i = fm[i, i_model].predict(h=h, X=X_, **kwargs)
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                model_name = repr(fm[i, i_model])
-                cols_m = [
-                    f"{model_name}" if col == "mean" else f"{model_name}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-            cols += cols_m
+                if keys is None:
+                    keys = _output_keys(res_i)
+                for i_key, key in enumerate(keys):
+                    fcsts[i * h : (i + 1) * h, cuts[i_model] + i_key] = res_i[key]
+            cols += _model_cols(fm[0, i_model], keys)
         return fcsts, cols
 
-    def fit_predict(self, models, h, X=None, level=tuple()):
+    def fit_predict(self, models, h, X=None, level=tuple(), keep_fitted="all"):
         # fitted models
-        fm = self.fit(models=models)
+        fm = self.fit(models=models, keep_fitted=keep_fitted)
         # forecasts
         fcsts, cols = self.predict(fm=fm, h=h, X=X, level=level)
         return fm, fcsts, cols
@@ -134,57 +260,213 @@ class GroupedArray:
         fcsts, cuts, has_level_models = self._output_fcst(
             models=models, attr="forecast", h=h, X=X, level=level
         )
-        matches = ["mean", "lo", "hi"]
+        keys = [None] * len(models)
         if fitted:
             # for the moment we dont return levels for fitted values in
             # forecast mode
             fitted_vals = np.full(
-                (self.data.shape[0], 1 + len(models)), np.nan, dtype=np.float32
+                (self.data.shape[0], 1 + len(models)), np.nan, dtype=self.dtype
             )
             if self.data.ndim == 1:
                 fitted_vals[:, 0] = self.data
             else:
                 fitted_vals[:, 0] = self.data[:, 0]
-        for i, grp in enumerate(self):
-            y_train = grp[:, 0] if grp.ndim == 2 else grp
-            X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
-            if X is not None:
-                X_f = X[i]
-            else:
-                X_f = None
-            cols = []
+        use_panel = self._panel_models(models=models, has_level_models=has_level_models)
+        if any(use_panel):
+            # models with a batched entry point compute all the series at once
+            y = self.data[:, 0] if self.data.ndim == 2 else self.data
+            y = y.astype(self.dtype, copy=False)
             for i_model, model in enumerate(models):
-                has_level = has_level_models[i_model]
-                kwargs = {}
-                if has_level:
-                    kwargs["level"] = level
-                res_i = model.forecast(
-                    h=h, y=y_train, X=X_train, X_future=X_f, fitted=fitted, **kwargs
-                )
-                cols_m = [
-                    key
-                    for key in res_i.keys()
-                    if any(key.startswith(m) for m in matches)
-                ]
-                fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                cols_m = [
-                    f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                    for col in cols_m
-                ]
-                if fcsts_i.ndim == 1:
-                    fcsts_i = fcsts_i[:, None]
-                fcsts[i * h : (i + 1) * h, cuts[i_model] : cuts[i_model + 1]] = fcsts_i
-                cols += cols_m
+                if not use_panel[i_model]:
+                    continue
+                res = model.forecast_panel(y=y, indptr=self.indptr, h=h, fitted=fitted)
+                fcsts[:, cuts[i_model]] = res["mean"]
                 if fitted:
-                    fitted_vals[
-                        self.indptr[i] : self.indptr[i + 1], i_model + 1
-                    ] = res_i["fitted"]
+                    fitted_vals[:, i_model + 1] = res["fitted"]
+        if not all(use_panel):
+            for i, grp in enumerate(self):
+                y_train = grp[:, 0] if grp.ndim == 2 else grp
+                X_train = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+                if X is not None:
+                    X_f = X[i]
+                else:
+                    X_f = None
+                for i_model, model in enumerate(models):
+                    if use_panel[i_model]:
+                        continue
+                    has_level = has_level_models[i_model]
+                    kwargs = {}
+                    if has_level:
+                        kwargs["level"] = level
+                    res_i = model.forecast(
+                        h=h, y=y_train, X=X_train, X_future=X_f, fitted=fitted, **kwargs
+                    )
+                    if keys[i_model] is None:
+                        keys[i_model] = _output_keys(res_i)
+                    for i_key, key in enumerate(keys[i_model]):
+                        fcsts[i * h : (i + 1) * h, cuts[i_model] + i_key] = res_i[key]
+                    if fitted:
+                        fitted_vals[
+                            self.indptr[i] : self.indptr[i + 1], i_model + 1
+                        ] = res_i["fitted"]
+        cols = [
+            col
+            for model, keys_m in zip(models, keys)
+            for col in _model_cols(model, keys_m)
+        ]
         result = {"forecasts": fcsts, "cols": cols}
         if fitted:
             result["fitted"] = {"values": fitted_vals}
             result["fitted"]["cols"] = ["y"] + [repr(model) for model in models]
         return result
 
+    def _cv_train_ranges(self, cutoffs, input_size=None):
+        # start (from the beginning of the serie) and size of the training part
+        # of each serie in each window, both of shape (n_groups, n_windows)
+        ends = np.maximum(np.diff(self.indptr)[:, None] + np.asarray(cutoffs), 0)
+        sizes = ends if input_size is None else np.minimum(ends, input_size)
+        return ends - sizes, sizes
+
+    def _check_cv_sizes(self, test_size):
+        # the windows of the series shorter than test_size would take rows of the previous serie
+        min_size = np.diff(self.indptr).min(initial=test_size)
+        if min_size < test_size:
+            raise ValueError(
+                f"The series must have at least `test_size` ({test_size}) observations, "
+                f"the shortest one has {min_size}"
+            )
+
+    def _cv_window(self, cutoff, h, input_size=None):
+        # training part of each serie for the window that ends `cutoff` periods
+        # before the end of the series, with the positions of the test rows in data.
+        # the panel models need contiguous groups, so the rows are gathered once per window
+        ends = self.indptr[1:] + cutoff
+        sizes = np.maximum(np.diff(self.indptr) + cutoff, 0)
+        if input_size is not None:
+            sizes = np.minimum(sizes, input_size)
+        # the mask is built from the boundaries of the groups instead of their positions,
+        # which would take eight bytes per row
+        non_empty = sizes > 0
+        bounds = np.zeros(self.data.shape[0] + 1, dtype=np.int8)
+        bounds[(ends - sizes)[non_empty]] += 1
+        bounds[ends[non_empty]] -= 1
+        train_mask = np.cumsum(bounds[:-1], dtype=np.int8).view(bool)
+        del bounds
+        indptr = np.append(0, np.cumsum(sizes)).astype(self.indptr.dtype)
+        if self.data.ndim == 1:
+            data = self.data[train_mask]
+        elif self.data.shape[1] == 1:
+            data = self.data[:, 0][train_mask][:, None]
+        else:
+            # numpy only selects the rows of 1d arrays without the positions of the mask
+            data = np.empty((indptr[-1], self.data.shape[1]), dtype=self.data.dtype)
+            for j in range(self.data.shape[1]):
+                data[:, j] = self.data[:, j][train_mask]
+        test_pos = (ends[:, None] + np.arange(h)).ravel()
+        return GroupedArray(data, indptr), test_pos
+
+    def cross_validation_windows(
+        self,
+        models,
+        h,
+        test_size,
+        step_size=1,
+        input_size=None,
+        fitted=False,
+        level=tuple(),
+        window_range=None,
+    ):
+        # forecasts of each window for all the series at once, one window at a time.
+        # yields the actual values of the window and the output of forecast,
+        # whose fitted values have the training part of each serie one after the other.
+        # window_range is the (start, end) of the windows to compute, all of them by default
+        if (test_size - h) % step_size:
+            raise Exception("`test_size - h` should be module `step_size`")
+        self._check_cv_sizes(test_size)
+        for cutoff in _cv_cutoffs(h, test_size, step_size, window_range):
+            train, test_pos = self._cv_window(cutoff, h, input_size)
+            test = self.data[test_pos]
+            X_future = None
+            if test.ndim == 2 and test.shape[1] > 1:
+                X_future = GroupedArray(
+                    test[:, 1:],
+                    h * np.arange(self.n_groups + 1, dtype=self.indptr.dtype),
+                )
+            res = train.forecast(
+                models=models, h=h, fitted=fitted, X=X_future, level=level
+            )
+            res["y"] = test[:, 0] if test.ndim == 2 else test
+            # the data of the window is released before computing the next one
+            del train
+            yield res
+
+    def _cv_incremental_series(
+        self, models, h, cutoffs, level, refit, cuts, fitted_arrays=None
+    ):
+        # the windows of each serie in order, the models are fitted in the first window
+        # (and every `refit` windows) and updated with the observations of the following ones.
+        # yields the position of each serie, its actual values and forecasts of shape (1 + cuts[-1], n_windows, h),
+        # which are overwritten by the next serie, and the output columns
+        _, has_level_models = self._get_cols(
+            models=models, attr="predict", h=h, X=None, level=level
+        )
+        keys = [None] * len(models)
+        cols = None
+        out = np.empty((1 + cuts[-1], len(cutoffs), h), dtype=self.dtype)
+        for i, grp in enumerate(self):
+            out.fill(np.nan)
+            y = grp[:, 0] if grp.ndim == 2 else grp
+            X = grp[:, 1:] if (grp.ndim == 2 and grp.shape[1] > 1) else None
+            ends = [y.size + cutoff for cutoff in cutoffs]
+            for i_window, end in enumerate(ends):
+                out[0, i_window] = y[end : end + h]
+                if fitted_arrays is not None:
+                    fitted_vals, offsets = fitted_arrays
+                    start = offsets[i, i_window]
+                    fitted_vals[start : start + end, 0] = y[:end]
+            for i_model, model in enumerate(models):
+                kwargs = {}
+                if has_level_models[i_model]:
+                    kwargs["level"] = level
+                fm = None
+                for i_window, end in enumerate(ends):
+                    if (
+                        fm is None
+                        or not hasattr(fm, "update")
+                        or (refit is not False and i_window % refit == 0)
+                    ):
+                        fm = model.new().fit(
+                            y=y[:end], X=None if X is None else X[:end]
+                        )
+                    else:
+                        new = slice(end - cutoffs.step, end)
+                        fm = fm.update(y=y[new], X=None if X is None else X[new])
+                    res_i = fm.predict(
+                        h=h, X=None if X is None else X[end : end + h], **kwargs
+                    )
+                    if keys[i_model] is None:
+                        keys[i_model] = _output_keys(res_i)
+                    for i_key, key in enumerate(keys[i_model]):
+                        out[1 + cuts[i_model] + i_key, i_window] = res_i[key]
+                    if fitted_arrays is not None:
+                        start = offsets[i, i_window]
+                        fitted_vals[
+                            start : start + end, i_model + 1
+                        ] = fm.predict_in_sample()["mean"]
+            if cols is None:
+                cols = [
+                    col
+                    for model, keys_m in zip(models, keys)
+                    for col in _model_cols(model, keys_m)
+                ]
+            yield i, out, cols
+
+    def _check_cv_refit(self, refit, input_size):
+        if refit is not True and input_size is not None:
+            raise ValueError(
+                "The models can only be updated in expanding windows, `input_size` must be None"
+            )
+
     def cross_validation(
         self,
         models,
@@ -194,102 +476,201 @@ class GroupedArray:
         input_size=None,
         fitted=False,
         level=tuple(),
+        refit=True,
+        window_range=None,
     ):
         # output of size: (ts, window, h)
         if (test_size - h) % step_size:
             raise Exception("`test_size - h` should be module `step_size`")
-        n_windows = int((test_size - h) / step_size) + 1
+        self._check_cv_refit(refit, input_size)
+        self._check_cv_sizes(test_size)
+        cutoffs = _cv_cutoffs(h, test_size, step_size, window_range)
+        n_windows = len(cutoffs)
         n_models = len(models)
-        cuts, has_level_models = self._get_cols(
-            models=models, attr="forecast", h=h, X=None, level=level
-        )
+        # the models updated between windows predict from their fitted state
+        attr = "forecast" if refit is True else "predict"
+        cuts, _ = self._get_cols(models=models, attr=attr, h=h, X=None, level=level)
         # first column of out is the actual y
+        # columns go first so each column of the output is contiguous
         out = np.full(
-            (self.n_groups, n_windows, h, 1 + cuts[-1]), np.nan, dtype=np.float32
+            (1 + cuts[-1], self.n_groups, n_windows, h), np.nan, dtype=self.dtype
         )
         if fitted:
+            # only the training rows of each window are stored, first by serie and then by window.
+            # offsets has the row where each (serie, window) starts
+            train_starts, train_sizes = self._cv_train_ranges(cutoffs, input_size)
+            offsets = (np.cumsum(train_sizes) - train_sizes.ravel()).reshape(
+                train_sizes.shape
+            )
             fitted_vals = np.full(
-                (self.data.shape[0], n_windows, n_models + 1), np.nan, dtype=np.float32
-            )
-            fitted_idxs = np.full((self.data.shape[0], n_windows), False, dtype=bool)
-            last_fitted_idxs = np.full_like(fitted_idxs, False, dtype=bool)
-        matches = ["mean", "lo", "hi"]
-        for i_ts, grp in enumerate(self):
-            for i_window, cutoff in enumerate(
-                range(-test_size, -h + 1, step_size), start=0
-            ):
-                end_cutoff = cutoff + h
-                in_size_disp = cutoff if input_size is None else input_size
-                y = grp[(cutoff - in_size_disp) : cutoff]
-                y_train = y[:, 0] if y.ndim == 2 else y
-                X_train = y[:, 1:] if (y.ndim == 2 and y.shape[1] > 1) else None
-                y_test = grp[cutoff:] if end_cutoff == 0 else grp[cutoff:end_cutoff]
-                X_future = (
-                    y_test[:, 1:]
-                    if (y_test.ndim == 2 and y_test.shape[1] > 1)
-                    else None
-                )
-                out[i_ts, i_window, :, 0] = y_test[:, 0] if y.ndim == 2 else y_test
-                if fitted:
-                    fitted_vals[self.indptr[i_ts] : self.indptr[i_ts + 1], i_window, 0][
-                        (cutoff - in_size_disp) : cutoff
-                    ] = y_train
-                    fitted_idxs[self.indptr[i_ts] : self.indptr[i_ts + 1], i_window][
-                        (cutoff - in_size_disp) : cutoff
-                    ] = True
-                    last_fitted_idxs[
-                        self.indptr[i_ts] : self.indptr[i_ts + 1], i_window
-                    ][cutoff - 1] = True
-                cols = ["y"]
-                for i_model, model in enumerate(models):
-                    has_level = has_level_models[i_model]
-                    kwargs = {}
-                    if has_level:
-                        kwargs["level"] = level
-                    res_i = model.forecast(
-                        h=h,
-                        y=y_train,
-                        X=X_train,
-                        X_future=X_future,
-                        fitted=fitted,
-                        **kwargs,
-                    )
-                    cols_m = [
-                        key
-                        for key in res_i.keys()
-                        if any(key.startswith(m) for m in matches)
-                    ]
-                    fcsts_i = np.vstack([res_i[key] for key in cols_m]).T
-                    cols_m = [
-                        f"{repr(model)}" if col == "mean" else f"{repr(model)}-{col}"
-                        for col in cols_m
-                    ]
-                    out[
-                        i_ts, i_window, :, (1 + cuts[i_model]) : (1 + cuts[i_model + 1])
-                    ] = fcsts_i
-                    if fitted:
-                        fitted_vals[
-                            self.indptr[i_ts] : self.indptr[i_ts + 1],
-                            i_window,
-                            i_model + 1,
-                        ][(cutoff - in_size_disp) : cutoff] = res_i["fitted"]
-                    cols += cols_m
-        result = {"forecasts": out.reshape(-1, 1 + cuts[-1]), "cols": cols}
+                (train_sizes.sum(), n_models + 1), np.nan, dtype=self.dtype
+            )
+        if refit is not True:
+            series = self._cv_incremental_series(
+                models=models,
+                h=h,
+                cutoffs=cutoffs,
+                level=level,
+                refit=refit,
+                cuts=cuts,
+                fitted_arrays=(fitted_vals, offsets) if fitted else None,
+            )
+            cols = []
+            for i, out_i, cols in series:
+                out[:, i] = out_i
+            windows = []
+        else:
+            windows = self.cross_validation_windows(
+                models=models,
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=fitted,
+                level=level,
+                window_range=window_range,
+            )
+        for i_window, res in enumerate(windows):
+            out[0, :, i_window] = res["y"].reshape(self.n_groups, h)
+            out[1:, :, i_window] = res["forecasts"].T.reshape(-1, self.n_groups, h)
+            if fitted:
+                # the fitted values of the window have the series one after the other
+                sizes = train_sizes[:, i_window]
+                fitted_vals[_segment_rows(offsets[:, i_window], sizes)] = res["fitted"][
+                    "values"
+                ]
+            cols = res["cols"]
+        result = {"forecasts": out.reshape(1 + cuts[-1], -1).T, "cols": ["y"] + cols}
         if fitted:
             result["fitted"] = {
                 "values": fitted_vals,
-                "idxs": fitted_idxs,
-                "last_idxs": last_fitted_idxs,
+                "starts": train_starts,
+                "sizes": train_sizes,
                 "cols": ["y"] + [repr(model) for model in models],
             }
         return result
 
+    def cross_validation_metrics(
+        self,
+        models,
+        h,
+        test_size,
+        step_size=1,
+        input_size=None,
+        level=tuple(),
+        refit=True,
+        season_length=1,
+        window_range=None,
+    ):
+        # numba is only loaded when the metrics are computed
+        from .cv_metrics import _cv_metrics_window
+
+        # sums of the errors of each serie over the windows, see `_cv_metrics_window`.
+        # the forecasts of each window are released after adding their errors
+        cutoffs = _cv_cutoffs(h, test_size, step_size, window_range)
+        train_starts, train_sizes = self._cv_train_ranges(cutoffs, input_size)
+        y = self.data[:, 0] if self.data.ndim == 2 else self.data
+        stats = None
+        if refit is True:
+            windows = self.cross_validation_windows(
+                models=models,
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                level=level,
+                window_range=window_range,
+            )
+            for i_window, res in enumerate(windows):
+                if stats is None:
+                    mean_idxs, lo_idxs, hi_idxs, intervals = _cv_metric_cols(
+                        models, res["cols"], level
+                    )
+                    stats = np.zeros(
+                        (
+                            self.n_groups,
+                            len(_CV_STATS) * len(models) + len(intervals) + 1,
+                        )
+                    )
+                fcsts = res["forecasts"]
+                _cv_metrics_window(
+                    y,
+                    self.indptr,
+                    train_starts[:, i_window],
+                    train_sizes[:, i_window],
+                    res["y"],
+                    fcsts[:, mean_idxs],
+                    fcsts[:, lo_idxs],
+                    fcsts[:, hi_idxs],
+                    h,
+                    season_length,
+                    len(_CV_STATS),
+                    stats,
+                )
+        else:
+            # the models are updated through the windows of each serie, so the errors are added by serie.
+            # its windows are the groups of the kernel, all of them start at the serie
+            self._check_cv_refit(refit, input_size)
+            self._check_cv_sizes(test_size)
+            cuts, _ = self._get_cols(
+                models=models, attr="predict", h=h, X=None, level=level
+            )
+            series = self._cv_incremental_series(
+                models=models,
+                h=h,
+                cutoffs=cutoffs,
+                level=level,
+                refit=refit,
+                cuts=cuts,
+            )
+            for i, out, cols in series:
+                if stats is None:
+                    mean_idxs, lo_idxs, hi_idxs, intervals = _cv_metric_cols(
+                        models, cols, level
+                    )
+                    stats = np.zeros(
+                        (
+                            self.n_groups,
+                            len(_CV_STATS) * len(models) + len(intervals) + 1,
+                        )
+                    )
+                    window_stats = np.empty((len(cutoffs), stats.shape[1]))
+                window_stats.fill(0)
+                fcsts = out[1:].reshape(out.shape[0] - 1, -1).T
+                _cv_metrics_window(
+                    y,
+                    np.full(len(cutoffs) + 1, self.indptr[i]),
+                    train_starts[i],
+                    train_sizes[i],
+                    out[0].ravel(),
+                    fcsts[:, mean_idxs],
+                    fcsts[:, lo_idxs],
+                    fcsts[:, hi_idxs],
+                    h,
+                    season_length,
+                    len(_CV_STATS),
+                    window_stats,
+                )
+                stats[i] = window_stats.sum(axis=0)
+        return {"stats": stats, "intervals": intervals}
+
+    def split_ranges(self, n_chunks, balanced=False):
+        # (start, end) of the groups of each chunk.
+        # balanced chunks have about the same number of observations instead of groups,
+        # since the cost of most models grows with the size of the serie
+        if not balanced:
+            return [
+                (x[0], x[-1] + 1)
+                for x in np.array_split(range(self.n_groups), n_chunks)
+                if x.size
+            ]
+        targets = self.indptr[-1] * np.arange(1, n_chunks) / n_chunks
+        cuts = np.searchsorted(self.indptr, targets)
+        cuts = np.unique(np.hstack([0, cuts, self.n_groups]))
+        return [(start, end) for start, end in zip(cuts[:-1], cuts[1:])]
+
     def split(self, n_chunks):
-        return [
-            self[x[0] : x[-1] + 1]
-            for x in np.array_split(range(self.n_groups), n_chunks)
-            if x.size
-        ]
+        return [self[start:end] for start, end in self.split_ranges(n_chunks)]
 
     def split_fm(self, fm, n_chunks):
         return [
@@ -298,60 +679,219 @@ class GroupedArray:
             if x.size
         ]
 
-# %% ../nbs/core.ipynb 16
-def _grouped_array_from_df(df, sort_df):
-    df = df.set_index("ds", append=True)
-    if not df.index.is_monotonic_increasing and sort_df:
-        df = df.sort_index()
-    data = df.values.astype(np.float32)
-    indices_sizes = df.index.get_level_values("unique_id").value_counts(sort=False)
-    indices = indices_sizes.index
-    sizes = indices_sizes.values
-    cum_sizes = sizes.cumsum()
-    dates = df.index.get_level_values("ds")[cum_sizes - 1]
-    indptr = np.append(0, cum_sizes).astype(np.int32)
-    return GroupedArray(data, indptr), indices, dates, df.index
-
-# %% ../nbs/core.ipynb 18
+# %% ../nbs/core.ipynb 20
+def _id_values(index):
+    # categorical ids are compared through their codes
+    if isinstance(index, pd.CategoricalIndex):
+        return index.codes
+    return index.to_numpy()
+
+
+def _ds_sorted(ids, ds):
+    # dates have to be increasing inside each serie
+    same_id = ids[1:] == ids[:-1]
+    return bool(np.all((ds[1:] >= ds[:-1]) | ~same_id))
+
+
+def _is_sorted_df(df):
+    # cheap check of the (unique_id, ds) order, avoids building a MultiIndex
+    if not df.index.is_monotonic_increasing:
+        return False
+    return _ds_sorted(_id_values(df.index), df["ds"].to_numpy())
+
+
+def _indptr_from_ids(ids):
+    # boundaries of each serie from the runs of the id column
+    starts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+    return np.hstack([0, starts, ids.size]).astype(np.int32)
+
+
+def _grouped_array_from_df(df, sort_df, dtype=np.float32):
+    if sort_df and not _is_sorted_df(df):
+        df = df.set_index("ds", append=True).sort_index().reset_index(level="ds")
+    indptr = _indptr_from_ids(_id_values(df.index))
+    value_cols = [col for col in df.columns if col != "ds"]
+    if len(value_cols) == 1:
+        # view of the target when it already has the right dtype
+        data = df[value_cols[0]].to_numpy(dtype=dtype, copy=False)[:, None]
+    else:
+        data = np.empty((df.shape[0], len(value_cols)), dtype=dtype)
+        for i, col in enumerate(value_cols):
+            data[:, i] = df[col].to_numpy()
+    ds = df["ds"].to_numpy()
+    indices = df.index[indptr[:-1]]
+    dates = pd.Index(ds[indptr[1:] - 1])
+    return GroupedArray(data, indptr), indices, dates, ds
+
+# %% ../nbs/core.ipynb 23
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ModuleNotFoundError as e:
+        msg = (
+            f"{e}. To use arrow or parquet inputs you have to install "
+            "pyarrow. Please run `pip install pyarrow`. "
+        )
+        raise ModuleNotFoundError(msg) from e
+    return pyarrow
+
+
+def _is_arrow_table(df):
+    # avoids importing pyarrow to check pandas inputs
+    return type(df).__module__.startswith("pyarrow") and hasattr(df, "column_names")
+
+
+def _arrow_id_codes(ids):
+    # codes of the ids that follow the order of their values
+    # integer ids are their own codes, other types are dictionary encoded
+    pa = _import_pyarrow()
+    import pyarrow.compute as pc
+
+    if pa.types.is_integer(ids.type) and ids.null_count == 0:
+        return ids.to_numpy(), None
+    if not pa.types.is_dictionary(ids.type):
+        ids = pc.dictionary_encode(ids)
+    ids = ids.unify_dictionaries()
+    if not ids.num_chunks:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=object)
+    dictionary = ids.chunk(0).dictionary.to_numpy(zero_copy_only=False)
+    codes = np.concatenate([chunk.indices.to_numpy() for chunk in ids.chunks])
+    order = np.argsort(dictionary, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    return rank[codes], dictionary[order]
+
+
+def _arrow_column_to_numpy(column, dtype, out=None):
+    # zero copy when the column is a single chunk of the right type without nulls
+    # otherwise the chunks are written one by one in the output buffer
+    if out is None and column.num_chunks == 1 and column.null_count == 0:
+        values = column.chunk(0).to_numpy(zero_copy_only=False)
+        if values.dtype == dtype:
+            return values
+    if out is None:
+        out = np.empty(len(column), dtype=dtype)
+    start = 0
+    for chunk in column.chunks:
+        end = start + len(chunk)
+        out[start:end] = chunk.to_numpy(zero_copy_only=False)
+        start = end
+    return out
+
+
+def _grouped_array_from_arrow(table, sort_df, dtype=np.float32):
+    codes, uniques = _arrow_id_codes(table.column("unique_id"))
+    ds = table.column("ds").to_numpy()
+    sorted_ = bool(np.all(codes[1:] >= codes[:-1])) and _ds_sorted(codes, ds)
+    if sort_df and not sorted_:
+        order = np.lexsort((ds, codes))
+        table = table.take(order)
+        codes = codes[order]
+        ds = ds[order]
+    indptr = _indptr_from_ids(codes)
+    value_cols = [col for col in table.column_names if col not in ("unique_id", "ds")]
+    if len(value_cols) == 1:
+        data = _arrow_column_to_numpy(table.column(value_cols[0]), dtype)[:, None]
+    else:
+        data = np.empty((table.num_rows, len(value_cols)), dtype=dtype)
+        for i, col in enumerate(value_cols):
+            _arrow_column_to_numpy(table.column(col), dtype, out=data[:, i])
+    uids = codes[indptr[:-1]]
+    if uniques is not None:
+        uids = uniques[uids]
+    indices = pd.Index(uids, name="unique_id")
+    dates = pd.Index(ds[indptr[1:] - 1])
+    return GroupedArray(data, indptr), indices, dates, ds
+
+# %% ../nbs/core.ipynb 24
+def _iter_parquet_chunks(path, chunk_size, columns=None):
+    # reads batches of rows and holds back the last serie of each batch
+    # until the next batch, so every chunk has complete series.
+    # the file has to be grouped by unique_id
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    carry = None
+    for batch in pq.ParquetFile(path).iter_batches(
+        batch_size=chunk_size, columns=columns
+    ):
+        table = pa.Table.from_batches([batch])
+        if carry is not None:
+            table = pa.concat_tables([carry, table])
+        codes, _ = _arrow_id_codes(table.column("unique_id"))
+        last_start = _indptr_from_ids(codes)[-2]
+        if last_start > 0:
+            yield table.slice(0, last_start)
+        carry = table.slice(last_start)
+    if carry is not None and carry.num_rows:
+        yield carry
+
+# %% ../nbs/core.ipynb 26
+def _offset_dates(last_dates, freq, offsets):
+    # dates `offsets` periods away from the last date of each serie, shape (n_series, n_offsets).
+    # integer dates and fixed frequencies are shifted with integer offsets,
+    # calendar frequencies are computed once for each unique last date
+    last_dates = np.asarray(last_dates)
+    offsets = np.asarray(offsets)
+    if issubclass(last_dates.dtype.type, np.integer):
+        return last_dates[:, None] + offsets.astype(last_dates.dtype)
+    if np.issubdtype(last_dates.dtype, np.datetime64) and isinstance(
+        freq, pd.offsets.Tick
+    ):
+        step = np.timedelta64(freq.nanos, "ns")
+        return last_dates.astype("datetime64[ns]")[:, None] + offsets * step
+    lo = min(offsets.min(), 0)
+    hi = max(offsets.max(), 0)
+    uniques, inverse = np.unique(last_dates, return_inverse=True)
+    grid = np.vstack(
+        [
+            pd.date_range(end=last_date, periods=1 - lo, freq=freq)
+            .append(pd.date_range(last_date + freq, periods=hi, freq=freq))
+            .to_numpy()
+            for last_date in uniques
+        ]
+    )
+    return grid[:, offsets - lo][inverse]
+
+
 def _cv_dates(last_dates, freq, h, test_size, step_size=1):
-    # assuming step_size = 1
     if (test_size - h) % step_size:
         raise Exception("`test_size - h` should be module `step_size`")
-    n_windows = int((test_size - h) / step_size) + 1
-    if len(np.unique(last_dates)) == 1:
-        if issubclass(last_dates.dtype.type, np.integer):
-            total_dates = np.arange(last_dates[0] - test_size + 1, last_dates[0] + 1)
-            out = np.empty((h * n_windows, 2), dtype=last_dates.dtype)
-            freq = 1
-        else:
-            total_dates = pd.date_range(end=last_dates[0], periods=test_size, freq=freq)
-            out = np.empty((h * n_windows, 2), dtype="datetime64[s]")
-        for i_window, cutoff in enumerate(
-            range(-test_size, -h + 1, step_size), start=0
-        ):
-            end_cutoff = cutoff + h
-            out[h * i_window : h * (i_window + 1), 0] = (
-                total_dates[cutoff:]
-                if end_cutoff == 0
-                else total_dates[cutoff:end_cutoff]
-            )
-            out[h * i_window : h * (i_window + 1), 1] = np.tile(
-                total_dates[cutoff] - freq, h
-            )
-        dates = pd.DataFrame(
-            np.tile(out, (len(last_dates), 1)), columns=["ds", "cutoff"]
-        )
-    else:
-        dates = pd.concat(
-            [
-                _cv_dates(np.array([ld]), freq, h, test_size, step_size)
-                for ld in last_dates
-            ]
-        )
-        dates = dates.reset_index(drop=True)
+    return _window_dates(last_dates, freq, h, np.arange(-test_size, -h + 1, step_size))
+
+
+def _window_dates(last_dates, freq, h, cutoffs):
+    # the cutoff of each window is `cutoff` periods before the last date
+    cutoffs = np.asarray(cutoffs)
+    ds_offsets = (cutoffs[:, None] + np.arange(1, h + 1)).ravel()
+    dates = pd.DataFrame(
+        {
+            "ds": _offset_dates(last_dates, freq, ds_offsets).ravel(),
+            "cutoff": _offset_dates(last_dates, freq, np.repeat(cutoffs, h)).ravel(),
+        }
+    )
+    if np.issubdtype(dates["ds"].dtype, np.datetime64):
+        dates = dates.astype("datetime64[s]")
     return dates
 
-# %% ../nbs/core.ipynb 22
+# %% ../nbs/core.ipynb 27
+def _uid_positions(positions, ids):
+    # positions of ids in a uid -> position map, -1 for the unknown ones.
+    # the dict lookups are cheaper than an Index for the few ids of a request
+    return np.array([positions.get(uid, -1) for uid in ids], dtype=np.intp)
+
+
+def _empty_ga(n_groups, dtype):
+    # GroupedArray without data to predict, which only uses the number of groups
+    return GroupedArray(
+        np.empty(0, dtype=dtype), np.zeros(n_groups + 1, dtype=np.int32)
+    )
+
+# %% ../nbs/core.ipynb 32
+# each job gets several chunks so the workers that finish early take the remaining ones
+_CHUNKS_PER_JOB = 4
+
+
 def _get_n_jobs(n_groups, n_jobs, ray_address):
     if ray_address is not None:
         logger.info("Using ray address," "using available resources insted of `n_jobs`")
@@ -373,7 +913,421 @@ def _get_n_jobs(n_groups, n_jobs, ray_address):
             actual_n_jobs = n_jobs
     return min(n_groups, actual_n_jobs)
 
-# %% ../nbs/core.ipynb 25
+# %% ../nbs/core.ipynb 33
+def warmup(
+    models: List[Any],  # List of instantiated models (`statsforecast.models`)
+    dtypes: Sequence[Any] = (np.float32,),  # Floating point types of the data
+    exogenous: bool = False,  # Compile also for series with exogenous variables
+):
+    """Compiles the kernels of the models forecasting short series.
+
+    Numba compiles a kernel for each type and memory layout of its inputs,
+    so every `dtype` is compiled for contiguous series and, with `exogenous`,
+    for series that are a column of the data with the exogenous variables.
+    Set `NUMBA_CACHE=true` to keep the compiled kernels on disk.
+    """
+    for model in models:
+        season_length = np.max(np.atleast_1d(getattr(model, "season_length", 1)))
+        n = 30 + 2 * season_length
+        for dtype in dtypes:
+            data = (np.arange(2 * n) % 7 + 1).astype(dtype).reshape(n, 2)
+            inputs: List[
+                Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]
+            ] = [(np.ascontiguousarray(data[:, 0]), None, None)]
+            if exogenous:
+                inputs.append((data[:, 0], data[:, 1:], data[:1, 1:]))
+            for y, X, X_future in inputs:
+                for fitted in [False, True]:
+                    try:
+                        model.forecast(y=y, h=1, X=X, X_future=X_future, fitted=fitted)
+                    except Exception:
+                        # models without fitted values or with other requirements
+                        # are compiled on their first call
+                        pass
+            if hasattr(model, "forecast_panel"):
+                y = np.ascontiguousarray(data[:, 0])
+                indptr = np.array([0, y.size], dtype=np.int32)
+                for fitted in [False, True]:
+                    try:
+                        model.forecast_panel(y=y, indptr=indptr, h=1, fitted=fitted)
+                    except Exception:
+                        pass
+
+# %% ../nbs/core.ipynb 34
+try:
+    from multiprocessing import shared_memory
+
+    _HAS_SHARED_MEMORY = True
+except ImportError:
+    # python < 3.8
+    _HAS_SHARED_MEMORY = False
+
+
+class _SharedArrays:
+    # numpy arrays in shared memory, the workers attach to them by name.
+    # the segments are released when leaving the context, so the arrays
+    # have to be copied before that if they're needed afterwards
+
+    def __init__(self):
+        self.segments = []
+        self.specs = {}
+        self.arrays = {}
+
+    def empty(self, key, shape, dtype):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        self.segments.append(shm)
+        self.specs[key] = (shm.name, tuple(shape), dtype.str)
+        self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return self.arrays[key]
+
+    def put(self, key, arr):
+        self.empty(key, arr.shape, arr.dtype)[...] = arr
+
+    def put_ga(self, key, ga):
+        self.put(f"{key}_data", ga.data)
+        self.put(f"{key}_indptr", ga.indptr)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.arrays = {}
+        for shm in self.segments:
+            shm.close()
+            shm.unlink()
+        self.segments = []
+
+
+def _run_attached(specs, fn):
+    # calls fn with the shared arrays and detaches once it returns
+    segments = {
+        key: shared_memory.SharedMemory(name=name)
+        for key, (name, _, _) in specs.items()
+    }
+    arrays = {
+        key: np.ndarray(shape, dtype=dtype, buffer=segments[key].buf)
+        for key, (_, shape, dtype) in specs.items()
+    }
+    try:
+        return fn(arrays)
+    finally:
+        arrays = None
+        for shm in segments.values():
+            try:
+                shm.close()
+            except BufferError:
+                # views still referenced by an exception, released with the process
+                pass
+
+
+def _shared_ga(arrays, key, start, end):
+    # groups [start, end) of a shared GroupedArray without copying the data
+    if f"{key}_data" not in arrays:
+        return None
+    return GroupedArray(arrays[f"{key}_data"], arrays[f"{key}_indptr"]).view(start, end)
+
+
+def _fit_shared(specs, start, end, models, prev_fm=None, keep_fitted="all"):
+    def fit(arrays):
+        return _shared_ga(arrays, "ga", start, end).fit(
+            models=models, prev_fm=prev_fm, keep_fitted=keep_fitted
+        )
+
+    return _run_attached(specs, fit)
+
+
+def _forecast_shared(specs, start, end, models, h, fitted, level):
+    def forecast(arrays):
+        ga = _shared_ga(arrays, "ga", start, end)
+        X = _shared_ga(arrays, "X", start, end)
+        res = ga.forecast(models=models, h=h, fitted=fitted, X=X, level=level)
+        arrays["forecasts"][start * h : end * h] = res["forecasts"]
+        if fitted:
+            indptr = arrays["ga_indptr"]
+            arrays["fitted"][indptr[start] : indptr[end]] = res["fitted"]["values"]
+        return res["cols"]
+
+    return _run_attached(specs, forecast)
+
+
+def _cross_validation_shared(
+    specs,
+    start,
+    end,
+    models,
+    h,
+    test_size,
+    step_size,
+    input_size,
+    fitted,
+    level,
+    refit=True,
+    window_range=None,
+):
+    def cross_validation(arrays):
+        ga = _shared_ga(arrays, "ga", start, end)
+        res = ga.cross_validation(
+            models=models,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            fitted=fitted,
+            level=level,
+            refit=refit,
+            window_range=window_range,
+        )
+        # the output has the columns as the first axis
+        out = arrays["forecasts"]
+        w_start, w_end = (0, out.shape[2]) if window_range is None else window_range
+        out[:, start:end, w_start:w_end] = res["forecasts"].T.reshape(
+            out.shape[0], end - start, w_end - w_start, out.shape[3]
+        )
+        if fitted:
+            rows = _segment_rows(
+                arrays["fitted_offsets"][start:end, w_start],
+                res["fitted"]["sizes"].sum(axis=1),
+            )
+            arrays["fitted_values"][rows] = res["fitted"]["values"]
+        return res["cols"]
+
+    return _run_attached(specs, cross_validation)
+
+
+def _cross_validation_metrics_shared(
+    specs,
+    start,
+    end,
+    models,
+    h,
+    test_size,
+    step_size,
+    input_size,
+    level,
+    refit,
+    season_length,
+    window_range,
+):
+    def cross_validation_metrics(arrays):
+        ga = _shared_ga(arrays, "ga", start, end)
+        return ga.cross_validation_metrics(
+            models=models,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            level=level,
+            refit=refit,
+            season_length=season_length,
+            window_range=window_range,
+        )
+
+    return _run_attached(specs, cross_validation_metrics)
+
+# %% ../nbs/core.ipynb 37
+class ColumnarResult:
+    """Outputs of `StatsForecast` as numpy arrays.
+
+    The columns of the models are views of the buffer where the forecasts
+    were computed, so building the result doesn't copy them.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,  # Id of each row
+        dates: Dict[
+            str, np.ndarray
+        ],  # Date columns, `ds` and `cutoff` for cross validation
+        values: np.ndarray,  # Buffer with the values of each column in `cols`
+        cols: List[str],  # Names of the columns of `values`
+    ):
+        self.ids = ids
+        self.dates = dates
+        self.values = values
+        self.cols = cols
+
+    @property
+    def columns(self) -> List[str]:
+        return ["unique_id", *self.dates.keys(), *self.cols]
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        if col == "unique_id":
+            return self.ids
+        if col in self.dates:
+            return self.dates[col]
+        return self.values[:, self.cols.index(col)]
+
+    def __repr__(self):
+        return f"ColumnarResult(n_rows={len(self):,}, columns={self.columns})"
+
+    def to_dict(self) -> Dict[str, np.ndarray]:
+        """Columns as a dictionary of arrays."""
+        return {col: self[col] for col in self.columns}
+
+    def to_pandas(
+        self,
+        index: bool = True,  # Set `unique_id` as the index?
+    ) -> pd.DataFrame:
+        """Columns as a DataFrame, the values are taken as a single block."""
+        df = pd.DataFrame(self.values, columns=self.cols, copy=False)
+        for i, (col, dates) in enumerate(self.dates.items()):
+            df.insert(i, col, dates)
+        if index:
+            df.index = pd.Index(self.ids, name="unique_id")
+        else:
+            df.insert(0, "unique_id", self.ids)
+        return df
+
+    def to_arrow(self):
+        """Columns as a pyarrow Table, contiguous columns aren't copied."""
+        pa = _import_pyarrow()
+        return pa.Table.from_arrays(
+            [pa.array(self[col]) for col in self.columns],
+            names=self.columns,
+        )
+
+# %% ../nbs/core.ipynb 38
+class ModelStore:
+    """Fitted models of `StatsForecast` saved as flat arrays.
+
+    Each entry that the models need to predict (parameters and last states)
+    is stored as a single array with the values of all the series, so the files
+    can be memory mapped and the models of a subset of series are restored
+    without reading the rest.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, PathLike],  # Directory written by `StatsForecast.save`
+        mmap: bool = True,  # Memory map the arrays instead of reading them
+    ):
+        path = Path(path)
+        with open(path / "meta.pkl", "rb") as f:
+            meta = pickle.load(f)
+
+        def load(name):
+            if mmap:
+                return np.load(path / name, mmap_mode="r")
+            return np.load(path / name)
+
+        self.models = meta["models"]
+        self.freq = meta["freq"]
+        self.dtype = meta["dtype"]
+        self.output = meta["output"]
+        self.uids = pd.Index(load("uids.npy"), name="unique_id")
+        self.last_dates = pd.Index(load("last_dates.npy"))
+        # key -> (values, size of each serie or offsets of the series)
+        self.arrays = []
+        for i_model, keys in enumerate(meta["keys"]):
+            arrays = {}
+            for key, size in keys.items():
+                values = load(f"{i_model}_{key}.npy")
+                if size is None:
+                    size = load(f"{i_model}_{key}_indptr.npy")
+                arrays[key] = (values, size)
+            self.arrays.append(arrays)
+        self._positions = None
+
+    @staticmethod
+    def save(path, models, fm, uids, last_dates, freq, dtype, output):
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        keys = []
+        for i_model in range(fm.shape[1]):
+            if not hasattr(fm[0, i_model], "_to_arrays"):
+                raise ValueError(f"{fm[0, i_model]} can not be saved in a ModelStore")
+            per_serie = [fm[i, i_model]._to_arrays() for i in range(fm.shape[0])]
+            sizes = {}
+            for key in per_serie[0].keys():
+                parts = [arrays[key] for arrays in per_serie]
+                serie_sizes = np.array([part.size for part in parts], dtype=np.int64)
+                # the offsets are only needed when the sizes differ among series
+                if (serie_sizes == serie_sizes[0]).all():
+                    sizes[key] = int(serie_sizes[0])
+                else:
+                    sizes[key] = None
+                    np.save(
+                        path / f"{i_model}_{key}_indptr.npy",
+                        np.append(0, np.cumsum(serie_sizes)),
+                    )
+                np.save(path / f"{i_model}_{key}.npy", np.concatenate(parts))
+            keys.append(sizes)
+        uids = np.asarray(uids)
+        if uids.dtype == object:
+            uids = uids.astype(str)
+        np.save(path / "uids.npy", uids)
+        np.save(path / "last_dates.npy", np.asarray(last_dates))
+        meta = dict(models=models, freq=freq, dtype=dtype, output=output, keys=keys)
+        with open(path / "meta.pkl", "wb") as f:
+            pickle.dump(meta, f)
+
+    def __len__(self):
+        return len(self.uids)
+
+    def __repr__(self):
+        return f'ModelStore(n_series={len(self):,}, models=[{",".join(map(repr, self.models))}])'
+
+    def _indices(self, ids):
+        if ids is None:
+            return np.arange(len(self))
+        if self._positions is None:
+            self._positions = {uid: i for i, uid in enumerate(self.uids)}
+        idxs = _uid_positions(self._positions, ids)
+        if (idxs == -1).any():
+            raise ValueError(f"{list(pd.Index(ids)[idxs == -1])} are not in the store")
+        return idxs
+
+    def fitted_models(
+        self,
+        ids: Optional[Sequence] = None,  # Series to restore, all of them by default
+    ) -> np.ndarray:
+        """Fitted models of the series `ids` with shape (n_series, n_models)."""
+        return self._fitted_models(self._indices(ids))
+
+    def _fitted_models(self, idxs):
+        fm = np.full((len(idxs), len(self.models)), np.nan, dtype=object)
+        for i_model, (model, arrays) in enumerate(zip(self.models, self.arrays)):
+            for i, idx in enumerate(idxs):
+                serie_arrays = {}
+                for key, (values, size) in arrays.items():
+                    if isinstance(size, int):
+                        start, end = idx * size, (idx + 1) * size
+                    else:
+                        start, end = size[idx], size[idx + 1]
+                    # copies of the slices, so the models don't keep the files open
+                    serie_arrays[key] = np.array(values[start:end])
+                fm[i, i_model] = model._from_arrays(serie_arrays)
+        return fm
+
+    def predict(
+        self,
+        h: int,  # Forecast horizon
+        ids: Optional[Sequence] = None,  # Series to forecast, all of them by default
+        level: Optional[List[int]] = None,  # Levels of probabilistic intervals
+    ):
+        """Forecasts of the series `ids` as `StatsForecast.predict`, models with exogenous regressors aren't supported."""
+        idxs = self._indices(ids)
+        fm = self._fitted_models(idxs)
+        fcsts, cols = _empty_ga(len(idxs), self.dtype).predict(
+            fm=fm, h=h, level=tuple() if level is None else level
+        )
+        dates = _offset_dates(self.last_dates[idxs], self.freq, np.arange(1, h + 1))
+        res = ColumnarResult(
+            ids=np.repeat(self.uids[idxs], h),
+            dates={"ds": dates.ravel()},
+            values=fcsts,
+            cols=cols,
+        )
+        if self.output == "columnar":
+            return res
+        return res.to_pandas()
+
+# %% ../nbs/core.ipynb 39
 class StatsForecast:
     def __init__(
         self,
@@ -383,23 +1337,81 @@ class StatsForecast:
         ray_address: Optional[str] = None,  # Optional ray address to distribute jobs
         df: Optional[
             pd.DataFrame
-        ] = None,  # DataFrame with columns `unique_id`, `ds`,`y`, and exogenous variables
+        ] = None,  # DataFrame or pyarrow Table with columns `unique_id`, `ds`,`y`, and exogenous variables
         sort_df: bool = True,  # Sort `df` according to `unique_id` and `ds`?
+        dtype: Any = np.float32,  # Floating point type of the data and the forecasts
+        output: str = "pandas",  # Type of the outputs, 'pandas' for DataFrames or 'columnar' for `ColumnarResult`
+        pool: Optional[
+            Any
+        ] = None,  # Pool with `apply_async` used by the parallel jobs. By default a pool is created on the first parallel call and reused until `close`
+        backend: str = "processes",  # Workers of the parallel jobs, 'processes' or 'threads' sharing the data of this process
+        keep_fitted: str = "all",  # Attributes kept by the fitted models, 'all' or 'minimal' to keep only what `predict` needs
     ):
         # needed for residuals, think about it later
         self.models = models
         self.freq = pd.tseries.frequencies.to_offset(freq)
         self.n_jobs = n_jobs
+        # n_jobs is limited by the number of series, cross validation can use more jobs
+        self._requested_n_jobs = n_jobs
         self.ray_address = ray_address
+        self.pool = pool
+        self._pool = None
+        if backend not in ("processes", "threads"):
+            raise ValueError(
+                f"backend must be either 'processes' or 'threads', got {backend}"
+            )
+        if backend == "threads" and ray_address is not None:
+            raise ValueError("The 'threads' backend can't be used with a ray cluster")
+        self.backend = backend
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(
+                f"dtype must be either float32 or float64, got {self.dtype}"
+            )
+        if output not in ("pandas", "columnar"):
+            raise ValueError(
+                f"output must be either 'pandas' or 'columnar', got {output}"
+            )
+        self.output = output
+        if keep_fitted not in ("all", "minimal"):
+            raise ValueError(
+                f"keep_fitted must be either 'all' or 'minimal', got {keep_fitted}"
+            )
+        self.keep_fitted = keep_fitted
         self._prepare_fit(df=df, sort_df=sort_df)
 
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str,  # File or directory of a (partitioned) parquet dataset
+        models: List[Any],  # List of instantiated models (`statsforecast.models`)
+        freq: str,  # Frequency of the data
+        columns: Optional[List[str]] = None,  # Columns to read, defaults to all of them
+        filters: Optional[
+            List[Any]
+        ] = None,  # Row filters passed to `pyarrow.parquet.read_table`
+        **kwargs,  # Other arguments passed to `StatsForecast`
+    ):
+        """Reads a parquet dataset with pyarrow and builds the series without a pandas DataFrame."""
+        _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, columns=columns, filters=filters)
+        return cls(models=models, freq=freq, df=table, **kwargs)
+
+    def _grouped_array(self, df, sort_df):
+        if _is_arrow_table(df):
+            return _grouped_array_from_arrow(df, sort_df, self.dtype)
+        if df.index.name != "unique_id":
+            df = df.set_index("unique_id")
+        return _grouped_array_from_df(df, sort_df, self.dtype)
+
     def _prepare_fit(self, df, sort_df):
         if df is not None:
-            if df.index.name != "unique_id":
-                df = df.set_index("unique_id")
-            self.ga, self.uids, self.last_dates, self.ds = _grouped_array_from_df(
+            self.ga, self.uids, self.last_dates, self.ds = self._grouped_array(
                 df, sort_df
             )
+            self._positions = None
             self.n_jobs = _get_n_jobs(len(self.ga), self.n_jobs, self.ray_address)
             self.sort_df = sort_df
 
@@ -412,38 +1424,115 @@ class StatsForecast:
     ):
         self._prepare_fit(df, sort_df)
         if self.n_jobs == 1:
-            self.fitted_ = self.ga.fit(models=self.models)
+            self.fitted_ = self.ga.fit(models=self.models, keep_fitted=self.keep_fitted)
         else:
             self.fitted_ = self._fit_parallel()
+        self._n_updates = 0
         return self
 
-    def _make_future_df(self, h: int):
-        if issubclass(self.last_dates.dtype.type, np.integer):
-            last_date_f = lambda x: np.arange(
-                x + 1, x + 1 + h, dtype=self.last_dates.dtype
+    def update(
+        self,
+        df: pd.DataFrame,  # DataFrame or pyarrow Table with the new observations, columns `unique_id`, `ds`, `y`, and exogenous variables
+        sort_df: bool = True,  # Sort `df` according to `unique_id` and `ds`?
+        refit_every: Optional[
+            int
+        ] = None,  # Estimate the parameters of the models again every `refit_every` updates
+    ):
+        """Appends new observations to the series and updates the fitted models keeping their parameters."""
+        refit = (
+            refit_every is not None
+            and (getattr(self, "_n_updates", 0) + 1) % refit_every == 0
+        )
+        if hasattr(self, "fitted_") and self.keep_fitted == "minimal" and not refit:
+            raise ValueError(
+                "The models fitted with keep_fitted='minimal' can only be updated by fitting them again, "
+                "use `refit_every=1`"
             )
-        else:
-            last_date_f = lambda x: pd.date_range(
-                x + self.freq, periods=h, freq=self.freq
+        new_ga, uids, _, ds = self._grouped_array(df, sort_df)
+        idxs = self.uids.get_indexer(uids)
+        if (idxs == -1).any():
+            raise ValueError(
+                f"The series {list(uids[idxs == -1][:5])} are not in the current data"
             )
-        if len(np.unique(self.last_dates)) == 1:
-            dates = np.tile(last_date_f(self.last_dates[0]), len(self.ga))
-        else:
-            dates = np.hstack([last_date_f(last_date) for last_date in self.last_dates])
-        idx = pd.Index(np.repeat(self.uids, h), name="unique_id")
-        df = pd.DataFrame({"ds": dates}, index=idx)
-        return df
+        if new_ga.data.shape[1:] != self.ga.data.shape[1:]:
+            raise ValueError(
+                f"Expected {self.ga.data.shape[1]} columns besides `ds`, got {new_ga.data.shape[1]}"
+            )
+        if (pd.Index(ds[new_ga.indptr[:-1]]) <= self.last_dates[idxs]).any():
+            raise ValueError(
+                "The new observations have to be after the last date of each serie"
+            )
+        indptr, pos, new_pos = _append_positions(self.ga.indptr, new_ga.indptr, idxs)
+        data = np.empty((indptr[-1], *self.ga.data.shape[1:]), dtype=self.ga.data.dtype)
+        data[pos] = self.ga.data
+        data[new_pos] = new_ga.data
+        all_ds = np.empty(indptr[-1], dtype=self.ds.dtype)
+        all_ds[pos] = self.ds
+        all_ds[new_pos] = ds
+        last_dates = self.last_dates.to_numpy().copy()
+        last_dates[idxs] = ds[new_ga.indptr[1:] - 1]
+        self.ga, self.ds, self.last_dates = (
+            GroupedArray(data, indptr),
+            all_ds,
+            pd.Index(last_dates),
+        )
+        if hasattr(self, "fitted_"):
+            self._n_updates += 1
+            if refit:
+                # the models with a warm start begin from their current fit
+                if self.n_jobs == 1:
+                    self.fitted_ = self.ga.fit(
+                        models=self.models,
+                        prev_fm=self.fitted_,
+                        keep_fitted=self.keep_fitted,
+                    )
+                else:
+                    self.fitted_ = self._fit_parallel(prev_fm=self.fitted_)
+            else:
+                self.fitted_ = self.ga.update(self.fitted_, new_ga, idxs)
+        return self
+
+    def _make_future_df(
+        self,
+        h: int,
+        fcsts: np.ndarray,
+        cols: List[str],
+        idxs: Optional[np.ndarray] = None,
+    ):
+        uids, last_dates = self.uids, self.last_dates
+        if idxs is not None:
+            uids, last_dates = uids[idxs], last_dates[idxs]
+        dates = _offset_dates(last_dates, self.freq, np.arange(1, h + 1))
+        return self._make_output(np.repeat(uids, h), {"ds": dates.ravel()}, fcsts, cols)
 
-    def _parse_X_level(self, h, X, level):
+    def _make_output(self, ids, dates, fcsts, cols):
+        res = ColumnarResult(ids=ids, dates=dates, values=fcsts, cols=cols)
+        if self.output == "columnar":
+            return res
+        return res.to_pandas()
+
+    def _parse_X_level(self, h, X, level, idxs=None):
         if X is not None:
             if X.index.name != "unique_id":
                 X = X.set_index("unique_id")
-            expected_shape = (h * len(self.ga), self.ga.data.shape[1])
+            n_series = len(self.ga) if idxs is None else len(idxs)
+            expected_shape = (h * n_series, self.ga.data.shape[1])
             if X.shape != expected_shape:
                 raise ValueError(
                     f"Expected X to have shape {expected_shape}, but got {X.shape}"
                 )
-            X, _, _, _ = _grouped_array_from_df(X, sort_df=self.sort_df)
+            X, X_uids, _, _ = _grouped_array_from_df(
+                X, sort_df=self.sort_df, dtype=self.dtype
+            )
+            if idxs is not None:
+                # the regressors in the order of the requested series
+                order = X_uids.get_indexer(self.uids[idxs])
+                if (order == -1).any():
+                    raise ValueError(
+                        "X_df must have the future values of the requested series"
+                    )
+                data = X.data.reshape(n_series, h, -1)[order].reshape(X.data.shape)
+                X = GroupedArray(data, X.indptr)
         if level is None:
             level = tuple()
         return X, level
@@ -453,15 +1542,45 @@ class StatsForecast:
         h: int,  # Forecast horizon
         X_df: Optional[pd.DataFrame] = None,  # Future exogenous regressors
         level: Optional[List[int]] = None,  # Levels of propabilistic intervals
+        ids: Optional[Sequence] = None,  # Series to predict, all of them by default
     ):
+        if ids is not None:
+            if getattr(self, "_positions", None) is None:
+                self._positions = {uid: i for i, uid in enumerate(self.uids)}
+            idxs = _uid_positions(self._positions, ids)
+            if (idxs == -1).any():
+                raise ValueError(
+                    f"The series {list(pd.Index(ids)[idxs == -1][:5])} are not in the current data"
+                )
+            X, level = self._parse_X_level(h=h, X=X_df, level=level, idxs=idxs)
+            # the few series of a request are predicted in this process,
+            # sending them to the workers would take longer than predicting them
+            fcsts, cols = _empty_ga(len(idxs), self.dtype).predict(
+                fm=self.fitted_[idxs], h=h, X=X, level=level
+            )
+            return self._make_future_df(h=h, fcsts=fcsts, cols=cols, idxs=idxs)
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
         if self.n_jobs == 1:
             fcsts, cols = self.ga.predict(fm=self.fitted_, h=h, X=X, level=level)
         else:
             fcsts, cols = self._predict_parallel(h=h, X=X, level=level)
-        df = self._make_future_df(h=h)
-        df[cols] = fcsts
-        return df
+        return self._make_future_df(h=h, fcsts=fcsts, cols=cols)
+
+    def save(
+        self,
+        path: Union[str, PathLike],  # Directory where the store is written
+    ):
+        """Saves the fitted models as a `ModelStore` that predicts for any subset of the series."""
+        ModelStore.save(
+            path,
+            models=self.models,
+            fm=self.fitted_,
+            uids=self.uids,
+            last_dates=self.last_dates,
+            freq=self.freq,
+            dtype=self.dtype,
+            output=self.output,
+        )
 
     def fit_predict(
         self,
@@ -477,15 +1596,18 @@ class StatsForecast:
         X, level = self._parse_X_level(h=h, X=X_df, level=level)
         if self.n_jobs == 1:
             self.fitted_, fcsts, cols = self.ga.fit_predict(
-                models=self.models, h=h, X=X, level=level
+                models=self.models,
+                h=h,
+                X=X,
+                level=level,
+                keep_fitted=self.keep_fitted,
             )
         else:
             self.fitted_, fcsts, cols = self._fit_predict_parallel(
                 h=h, X=X, level=level
             )
-        df = self._make_future_df(h=h)
-        df[cols] = fcsts
-        return df
+        self._n_updates = 0
+        return self._make_future_df(h=h, fcsts=fcsts, cols=cols)
 
     def forecast(
         self,
@@ -510,17 +1632,79 @@ class StatsForecast:
             self.fcst_fitted_values_ = res_fcsts["fitted"]
         fcsts = res_fcsts["forecasts"]
         cols = res_fcsts["cols"]
-        df = self._make_future_df(h=h)
-        df[cols] = fcsts
-        return df
+        return self._make_future_df(h=h, fcsts=fcsts, cols=cols)
+
+    def forecast_stream(
+        self,
+        h: int,  # Forecast horizon
+        dfs: Union[
+            str, PathLike, Iterable[Any]
+        ],  # Parquet file grouped by `unique_id` or iterable of DataFrames/pyarrow Tables with complete series
+        X_dfs: Optional[
+            Iterable[pd.DataFrame]
+        ] = None,  # Future exogenous regressors of each chunk
+        level: Optional[List[int]] = None,  # Levels of probabilistic intervals
+        chunk_size: int = 1_000_000,  # Number of rows read at a time when `dfs` is a parquet file
+        sort_df: bool = True,  # Sort each chunk according to `unique_id` and `ds`?
+    ) -> Iterator[pd.DataFrame]:
+        """Forecasts the series one chunk at a time and yields the forecasts of each chunk."""
+        chunks: Iterable[Any]
+        if isinstance(dfs, (str, PathLike)):
+            chunks = _iter_parquet_chunks(dfs, chunk_size)
+        else:
+            chunks = dfs
+        if X_dfs is None:
+            X_dfs = repeat(None)
+        n_jobs = self.n_jobs
+        for df, X_df in zip(chunks, X_dfs):
+            # small chunks shouldn't limit the jobs of the following ones
+            self.n_jobs = n_jobs
+            yield self.forecast(h=h, df=df, X_df=X_df, level=level, sort_df=sort_df)
+        self.n_jobs = n_jobs
+
+    def forecast_to_parquet(
+        self,
+        path: Union[str, PathLike],  # Output parquet file
+        h: int,  # Forecast horizon
+        dfs: Union[
+            str, PathLike, Iterable[Any]
+        ],  # Parquet file grouped by `unique_id` or iterable of DataFrames/pyarrow Tables with complete series
+        **kwargs,  # Other arguments passed to `forecast_stream`
+    ):
+        """Writes the forecasts of each chunk to a parquet file as soon as they're computed."""
+        pa = _import_pyarrow()
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for fcsts in self.forecast_stream(h=h, dfs=dfs, **kwargs):
+                if isinstance(fcsts, ColumnarResult):
+                    table = fcsts.to_arrow()
+                else:
+                    table = pa.Table.from_pandas(
+                        fcsts.reset_index(), preserve_index=False
+                    )
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _repeated_uids(self):
+        # id of each row of the training data
+        return self.uids.repeat(np.diff(self.ga.indptr))
 
     def forecast_fitted_values(self):
         if not hasattr(self, "fcst_fitted_values_"):
             raise Exception("Please run `forecast` mehtod using `fitted=True`")
         cols = self.fcst_fitted_values_["cols"]
         df = pd.DataFrame(
-            self.fcst_fitted_values_["values"], columns=cols, index=self.ds
-        ).reset_index(level=1)
+            self.fcst_fitted_values_["values"],
+            columns=cols,
+            index=self._repeated_uids(),
+        )
+        df.insert(0, "ds", self.ds)
         return df
 
     def cross_validation(
@@ -538,7 +1722,67 @@ class StatsForecast:
         level: Optional[List[int]] = None,  # Levels of probabilistic intervals
         fitted: bool = False,  # Save fitted values for each window and each model?
         sort_df: bool = True,  # Sort `df` according to `unique_id` and `ds`?
+        refit: Union[
+            bool, int
+        ] = True,  # Fit the models in every window (`True`), only in the first one (`False`) or every `refit` windows. In between, the models with an `update` method are updated with the new observations
     ):
+        test_size, n_windows = self._parse_cv_windows(
+            h, n_windows, step_size, test_size
+        )
+        if not isinstance(refit, (bool, int)) or (refit is not False and refit < 1):
+            raise ValueError(
+                f"refit must be a boolean or a positive integer, got {refit}"
+            )
+        self._prepare_fit(df, sort_df)
+        _, level = self._parse_X_level(h=h, X=None, level=level)
+        n_jobs = self.n_jobs
+        self.n_jobs = self._cv_n_jobs(n_windows, refit)
+        try:
+            if self.n_jobs == 1:
+                res_fcsts = self.ga.cross_validation(
+                    models=self.models,
+                    h=h,
+                    test_size=test_size,
+                    step_size=step_size,
+                    input_size=input_size,
+                    fitted=fitted,
+                    level=level,
+                    refit=refit,
+                )
+            else:
+                res_fcsts = self._cross_validation_parallel(
+                    h=h,
+                    test_size=test_size,
+                    step_size=step_size,
+                    input_size=input_size,
+                    fitted=fitted,
+                    level=level,
+                    refit=refit,
+                )
+        finally:
+            self.n_jobs = n_jobs
+
+        if fitted:
+            self.cv_fitted_values_ = res_fcsts["fitted"]
+            self.n_cv_ = n_windows
+
+        fcsts = res_fcsts["forecasts"]
+        cols = res_fcsts["cols"]
+        dates = _cv_dates(
+            last_dates=self.last_dates,
+            freq=self.freq,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+        )
+        return self._make_output(
+            np.repeat(self.uids, h * n_windows),
+            {"ds": dates["ds"].to_numpy(), "cutoff": dates["cutoff"].to_numpy()},
+            fcsts,
+            cols,
+        )
+
+    def _parse_cv_windows(self, h, n_windows, step_size, test_size):
         if test_size is None:
             test_size = h + step_size * (n_windows - 1)
         elif n_windows is None:
@@ -549,63 +1793,186 @@ class StatsForecast:
             raise Exception("you must define `n_windows` or `test_size`")
         else:
             raise Exception("you must define `n_windows` or `test_size` but not both")
+        return test_size, n_windows
+
+    def cross_validation_stream(
+        self,
+        h: int,  # Forecast horizon
+        df: Optional[
+            pd.DataFrame
+        ] = None,  # DataFrame with columns `unique_id`, `ds`, `y`, and exogenous variables
+        n_windows: int = 1,  # Number of windows used for cross validation
+        step_size: int = 1,  # Step size between each window
+        test_size: Optional[
+            int
+        ] = None,  # Lenght of test size. If passed, set `n_windows=None`
+        input_size: Optional[int] = None,  # Input size for each window
+        level: Optional[List[int]] = None,  # Levels of probabilistic intervals
+        sort_df: bool = True,  # Sort `df` according to `unique_id` and `ds`?
+    ) -> Iterator[pd.DataFrame]:
+        """Computes the windows of `cross_validation` one at a time and yields the forecasts of each window."""
+        test_size, _ = self._parse_cv_windows(h, n_windows, step_size, test_size)
         self._prepare_fit(df, sort_df)
         _, level = self._parse_X_level(h=h, X=None, level=level)
-        if self.n_jobs == 1:
-            res_fcsts = self.ga.cross_validation(
-                models=self.models,
-                h=h,
-                test_size=test_size,
-                step_size=step_size,
-                input_size=input_size,
-                fitted=fitted,
-                level=level,
+        windows = self.ga.cross_validation_windows(
+            models=self.models,
+            h=h,
+            test_size=test_size,
+            step_size=step_size,
+            input_size=input_size,
+            level=level,
+        )
+        uids = np.repeat(self.uids, h)
+        for cutoff, res in zip(_cv_cutoffs(h, test_size, step_size), windows):
+            dates = _window_dates(self.last_dates, self.freq, h, [cutoff])
+            out = np.empty(
+                (res["y"].size, 1 + res["forecasts"].shape[1]),
+                dtype=self.dtype,
+                order="F",
             )
-        else:
-            res_fcsts = self._cross_validation_parallel(
-                h=h,
-                test_size=test_size,
-                step_size=step_size,
-                input_size=input_size,
-                fitted=fitted,
-                level=level,
+            out[:, 0] = res["y"]
+            out[:, 1:] = res["forecasts"]
+            yield self._make_output(
+                uids,
+                {"ds": dates["ds"].to_numpy(), "cutoff": dates["cutoff"].to_numpy()},
+                out,
+                ["y"] + res["cols"],
             )
 
-        if fitted:
-            self.cv_fitted_values_ = res_fcsts["fitted"]
-            self.n_cv_ = n_windows
+    def cross_validation_metrics(
+        self,
+        h: int,  # Forecast horizon
+        df: Optional[
+            pd.DataFrame
+        ] = None,  # DataFrame with columns `unique_id`, `ds`, `y`, and exogenous variables
+        n_windows: int = 1,  # Number of windows used for cross validation
+        step_size: int = 1,  # Step size between each window
+        test_size: Optional[
+            int
+        ] = None,  # Lenght of test size. If passed, set `n_windows=None`
+        input_size: Optional[int] = None,  # Input size for each window
+        level: Optional[
+            List[int]
+        ] = None,  # Levels of the intervals whose coverage is computed
+        sort_df: bool = True,  # Sort `df` according to `unique_id` and `ds`?
+        refit: Union[
+            bool, int
+        ] = True,  # Fit the models in every window (`True`), only in the first one (`False`) or every `refit` windows
+        season_length: int = 1,  # Seasonal period of the naive forecast that scales the errors of MASE
+    ):
+        """Errors of the cross validation of each serie and model, without building the forecasts of the windows.
 
-        fcsts = res_fcsts["forecasts"]
-        cols = res_fcsts["cols"]
-        df = _cv_dates(
-            last_dates=self.last_dates,
-            freq=self.freq,
-            h=h,
-            test_size=test_size,
-            step_size=step_size,
+        The rows have the `mae`, `rmse`, `smape` (`|y - y_hat| / (|y| + |y_hat|)`), `mase`
+        and, for each level, the `coverage` of the intervals of each serie over all the windows.
+        The errors of MASE are scaled by the in-sample MAE of the seasonal naive in the training part of each window,
+        the windows where it's zero or undefined (training part not longer than `season_length`) are left out of the mean.
+        """
+        test_size, n_windows = self._parse_cv_windows(
+            h, n_windows, step_size, test_size
+        )
+        if not isinstance(refit, (bool, int)) or (refit is not False and refit < 1):
+            raise ValueError(
+                f"refit must be a boolean or a positive integer, got {refit}"
+            )
+        self._prepare_fit(df, sort_df)
+        _, level = self._parse_X_level(h=h, X=None, level=level)
+        n_jobs = self.n_jobs
+        self.n_jobs = self._cv_n_jobs(n_windows, refit)
+        try:
+            if self.n_jobs == 1:
+                res = self.ga.cross_validation_metrics(
+                    models=self.models,
+                    h=h,
+                    test_size=test_size,
+                    step_size=step_size,
+                    input_size=input_size,
+                    level=level,
+                    refit=refit,
+                    season_length=season_length,
+                )
+            else:
+                res = self._cross_validation_metrics_parallel(
+                    h=h,
+                    test_size=test_size,
+                    step_size=step_size,
+                    input_size=input_size,
+                    level=level,
+                    refit=refit,
+                    season_length=season_length,
+                )
+        finally:
+            self.n_jobs = n_jobs
+        # means of the errors over the h forecasts of each window
+        n_models = len(self.models)
+        stats = res["stats"] / (n_windows * h)
+        errors = stats[:, : len(_CV_STATS) * n_models].reshape(
+            self.ga.n_groups, n_models, len(_CV_STATS)
+        )
+        metrics = list(_CV_STATS) + [f"coverage-{lv}" for lv in level]
+        values = np.full((self.ga.n_groups, len(metrics), n_models), np.nan)
+        values[:, : len(_CV_STATS)] = errors.transpose(0, 2, 1)
+        values[:, _CV_STATS.index("rmse")] **= 0.5
+        # mase is the mean over the windows with a positive scale, nan if there are none
+        i_mase = _CV_STATS.index("mase")
+        with np.errstate(invalid="ignore"):
+            values[:, i_mase] = (
+                res["stats"][:, i_mase : len(_CV_STATS) * n_models : len(_CV_STATS)]
+                / res["stats"][:, [-1]]
+            )
+        for k, (i_model, lv) in enumerate(res["intervals"]):
+            values[:, len(_CV_STATS) + list(level).index(lv), i_model] = stats[
+                :, len(_CV_STATS) * n_models + k
+            ]
+        return self._make_output(
+            np.repeat(self.uids, len(metrics)),
+            {"metric": np.tile(metrics, self.ga.n_groups)},
+            values.reshape(-1, n_models),
+            [repr(model) for model in self.models],
         )
-        idx = pd.Index(np.repeat(self.uids, h * n_windows), name="unique_id")
-        df.index = idx
-        df[cols] = fcsts
-        return df
 
     def cross_validation_fitted_values(self):
         if not hasattr(self, "cv_fitted_values_"):
             raise Exception("Please run `cross_validation` mehtod using `fitted=True`")
-        index = pd.MultiIndex.from_tuples(
-            np.tile(self.ds, self.n_cv_), names=["unique_id", "ds"]
+        fitted = self.cv_fitted_values_
+        # the values are stored by serie and window, the output has the windows first
+        sizes = fitted["sizes"]
+        offsets = np.cumsum(sizes).reshape(sizes.shape) - sizes
+        sizes, offsets, starts = (
+            sizes.T.ravel(),
+            offsets.T.ravel(),
+            fitted["starts"].T.ravel(),
         )
-        df = pd.DataFrame(index=index)
-        df["cutoff"] = self.cv_fitted_values_["last_idxs"].flatten(order="F")
-        df[self.cv_fitted_values_["cols"]] = np.reshape(
-            self.cv_fitted_values_["values"], (-1, len(self.models) + 1), order="F"
+        starts = starts + np.tile(self.ga.indptr[:-1], self.n_cv_)
+        ends = starts + sizes
+        # row of each output in the values and in the training data, built in place
+        # since these arrays are as long as the output
+        seg_starts = np.cumsum(sizes) - sizes
+        arange = np.arange(sizes.sum())
+        rows = np.repeat(offsets - seg_starts, sizes)
+        rows += arange
+        positions = np.repeat(starts - seg_starts, sizes)
+        positions += arange
+        del arange
+        df = pd.DataFrame(
+            fitted["values"][rows],
+            columns=fitted["cols"],
+            index=pd.Index(
+                np.repeat(np.tile(np.asarray(self.uids), self.n_cv_), sizes),
+                name="unique_id",
+            ),
         )
-        idxs = self.cv_fitted_values_["idxs"].flatten(order="F")
-        df = df.iloc[idxs].reset_index(level=1)
-        df["cutoff"] = df["ds"].where(df["cutoff"]).bfill()
+        del rows
+        df.insert(0, "ds", self.ds[positions])
+        df.insert(1, "cutoff", np.repeat(self.ds[ends - 1], sizes))
         return df
 
     def _get_pool(self):
+        # long lived pool, created on the first parallel call and reused afterwards
+        if self.pool is not None:
+            return self.pool
+        if self._pool is not None and self._pool_n_jobs >= self.n_jobs:
+            return self._pool
+        self.close()
         if self.ray_address is not None:
             try:
                 from ray.util.multiprocessing import Pool
@@ -616,27 +1983,130 @@ class StatsForecast:
                 )
                 raise ModuleNotFoundError(msg) from e
             pool_kwargs = dict(ray_address=self.ray_address)
+        elif self.backend == "threads":
+            # the kernels of the models release the GIL
+            from multiprocessing.pool import ThreadPool as Pool
+
+            pool_kwargs = dict()
         else:
             from multiprocessing import Pool
 
+            if _HAS_SHARED_MEMORY:
+                # the workers have to share the resource tracker of this process
+                # to attach to the shared memory segments
+                from multiprocessing import resource_tracker
+
+                resource_tracker.ensure_running()
             pool_kwargs = dict()
-        return Pool, pool_kwargs
-
-    def _fit_parallel(self):
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga in gas:
-                future = executor.apply_async(ga.fit, (self.models,))
-                futures.append(future)
+        # the workers start with the kernels of the models compiled
+        warmup_args = (self.models, (self.dtype,), self.ga.data.shape[1] > 1)
+        if self.ray_address is None and self.backend == "threads":
+            # the threads share the kernels compiled by this one
+            warmup(*warmup_args)
+        else:
+            pool_kwargs.update(initializer=warmup, initargs=warmup_args)
+        self._pool = Pool(self.n_jobs, **pool_kwargs)
+        self._pool_n_jobs = self.n_jobs
+        self._pool_finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self):
+        """Stops the workers of the pool created by `StatsForecast`, a pool passed by the user isn't closed."""
+        if self._pool is not None:
+            self._pool_finalizer()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        # pools can't be pickled
+        state = self.__dict__.copy()
+        for attr in ["pool", "_pool", "_pool_finalizer"]:
+            state[attr] = None
+        return state
+
+    def _use_shared_memory(self):
+        # the local pool shares the data with the workers instead of pickling it
+        return (
+            self.ray_address is None
+            and self.backend == "processes"
+            and _HAS_SHARED_MEMORY
+        )
+
+    def _chunk_ranges(self):
+        # several chunks per job with about the same number of observations,
+        # the pool hands them to the workers as they become free
+        n_chunks = min(self.ga.n_groups, _CHUNKS_PER_JOB * self.n_jobs)
+        return self.ga.split_ranges(n_chunks, balanced=True)
+
+    def _cv_n_jobs(self, n_windows, refit=True):
+        # the windows can be split between the jobs too, so there can be more jobs than series
+        n_tasks = self.ga.n_groups * -(-n_windows // _cv_block_size(n_windows, refit))
+        return _get_n_jobs(
+            n_tasks, getattr(self, "_requested_n_jobs", self.n_jobs), self.ray_address
+        )
+
+    def _cv_chunk_ranges(self, n_windows, refit=True):
+        # (start, end) of the series and (start, end) of the windows of each task.
+        # when there are fewer chunks of series than tasks for the jobs the windows are split as well,
+        # the models updated between windows are only split where they're fitted again
+        series_ranges = self._chunk_ranges()
+        block = _cv_block_size(n_windows, refit)
+        n_blocks = -(-n_windows // block)
+        n_window_chunks = min(
+            n_blocks, -(-_CHUNKS_PER_JOB * self.n_jobs // len(series_ranges))
+        )
+        window_ranges = [
+            (x[0] * block, min((x[-1] + 1) * block, n_windows))
+            for x in np.array_split(np.arange(n_blocks), n_window_chunks)
+        ]
+        return [
+            (series, windows) for series in series_ranges for windows in window_ranges
+        ]
+
+    def _fit_parallel(self, prev_fm=None):
+        if self._use_shared_memory():
+            return self._fit_shared(prev_fm)
+        executor = self._get_pool()
+        futures = []
+        for start, end in self._chunk_ranges():
+            ga = self.ga.view(start, end)
+            prev = None if prev_fm is None else prev_fm[start:end]
+            future = executor.apply_async(ga.fit, (self.models, prev, self.keep_fitted))
+            futures.append(future)
+        fm = np.vstack([f.get() for f in futures])
+        return fm
+
+    def _fit_shared(self, prev_fm=None):
+        with _SharedArrays() as shared:
+            shared.put_ga("ga", self.ga)
+            executor = self._get_pool()
+            futures = [
+                executor.apply_async(
+                    _fit_shared,
+                    (
+                        shared.specs,
+                        start,
+                        end,
+                        self.models,
+                        None if prev_fm is None else prev_fm[start:end],
+                        self.keep_fitted,
+                    ),
+                )
+                for start, end in self._chunk_ranges()
+            ]
             fm = np.vstack([f.get() for f in futures])
         return fm
 
     def _get_gas_Xs(self, X):
-        gas = self.ga.split(self.n_jobs)
+        ranges = self._chunk_ranges()
+        gas = [self.ga.view(start, end) for start, end in ranges]
         if X is not None:
-            Xs = X.split(self.n_jobs)
+            Xs = [X.view(start, end) for start, end in ranges]
         else:
             from itertools import repeat
 
@@ -646,100 +2116,222 @@ class StatsForecast:
     def _predict_parallel(self, h, X, level):
         # create elements for each core
         gas, Xs = self._get_gas_Xs(X=X)
-        fms = self.ga.split_fm(self.fitted_, self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        fms = [self.fitted_[start:end] for start, end in self._chunk_ranges()]
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, fm, X_ in zip(gas, fms, Xs):
-                future = executor.apply_async(
-                    ga.predict,
-                    (
-                        fm,
-                        h,
-                        X_,
-                        level,
-                    ),
-                )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts, cols = list(zip(*out))
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+        executor = self._get_pool()
+        futures = []
+        for ga, fm, X_ in zip(gas, fms, Xs):
+            future = executor.apply_async(
+                ga.predict,
+                (
+                    fm,
+                    h,
+                    X_,
+                    level,
+                ),
+            )
+            futures.append(future)
+        out = [f.get() for f in futures]
+        fcsts, cols = list(zip(*out))
+        fcsts = np.vstack(fcsts)
+        cols = cols[0]
         return fcsts, cols
 
     def _fit_predict_parallel(self, h, X, level):
         # create elements for each core
         gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
-                    ga.fit_predict,
-                    (
-                        self.models,
-                        h,
-                        X_,
-                        level,
-                    ),
-                )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fm, fcsts, cols = list(zip(*out))
-            fm = np.vstack(fm)
-            fcsts = np.vstack(fcsts)
-            cols = cols[0]
+        executor = self._get_pool()
+        futures = []
+        for ga, X_ in zip(gas, Xs):
+            future = executor.apply_async(
+                ga.fit_predict, (self.models, h, X_, level, self.keep_fitted)
+            )
+            futures.append(future)
+        out = [f.get() for f in futures]
+        fm, fcsts, cols = list(zip(*out))
+        fm = np.vstack(fm)
+        fcsts = np.vstack(fcsts)
+        cols = cols[0]
         return fm, fcsts, cols
 
     def _forecast_parallel(self, h, fitted, X, level):
+        if self._use_shared_memory():
+            return self._forecast_shared(h=h, fitted=fitted, X=X, level=level)
         # create elements for each core
         gas, Xs = self._get_gas_Xs(X=X)
-        Pool, pool_kwargs = self._get_pool()
         # compute parallel forecasts
         result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga, X_ in zip(gas, Xs):
-                future = executor.apply_async(
-                    ga.forecast,
+        executor = self._get_pool()
+        futures = []
+        for ga, X_ in zip(gas, Xs):
+            future = executor.apply_async(
+                ga.forecast,
+                (
+                    self.models,
+                    h,
+                    fitted,
+                    X_,
+                    level,
+                ),
+            )
+            futures.append(future)
+        out = [f.get() for f in futures]
+        fcsts = [d["forecasts"] for d in out]
+        fcsts = np.vstack(fcsts)
+        cols = out[0]["cols"]
+        result["forecasts"] = fcsts
+        result["cols"] = cols
+        if fitted:
+            result["fitted"] = {}
+            fitted_vals = [d["fitted"]["values"] for d in out]
+            result["fitted"]["values"] = np.vstack(fitted_vals)
+            result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+        return result
+
+    def _forecast_shared(self, h, fitted, X, level):
+        # the workers write their forecasts in the shared outputs
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr="forecast", h=h, X=X, level=level
+        )
+        result = {}
+        with _SharedArrays() as shared:
+            shared.put_ga("ga", self.ga)
+            if X is not None:
+                shared.put_ga("X", X)
+            shared.empty("forecasts", (self.ga.n_groups * h, cuts[-1]), self.ga.dtype)
+            if fitted:
+                shared.empty(
+                    "fitted",
+                    (self.ga.data.shape[0], 1 + len(self.models)),
+                    self.ga.dtype,
+                )
+            executor = self._get_pool()
+            futures = [
+                executor.apply_async(
+                    _forecast_shared,
                     (
+                        shared.specs,
+                        start,
+                        end,
                         self.models,
                         h,
                         fitted,
-                        X_,
                         level,
                     ),
                 )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
+                for start, end in self._chunk_ranges()
+            ]
+            result["cols"] = [f.get() for f in futures][0]
+            result["forecasts"] = shared.arrays["forecasts"].copy(order="F")
             if fitted:
-                result["fitted"] = {}
-                fitted_vals = [d["fitted"]["values"] for d in out]
-                result["fitted"]["values"] = np.vstack(fitted_vals)
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+                result["fitted"] = {
+                    "values": shared.arrays["fitted"].copy(),
+                    "cols": ["y"] + [repr(model) for model in self.models],
+                }
         return result
 
     def _cross_validation_parallel(
-        self, h, test_size, step_size, input_size, fitted, level
+        self, h, test_size, step_size, input_size, fitted, level, refit=True
     ):
-        # create elements for each core
-        gas = self.ga.split(self.n_jobs)
-        Pool, pool_kwargs = self._get_pool()
+        if self._use_shared_memory():
+            return self._cross_validation_shared(
+                h=h,
+                test_size=test_size,
+                step_size=step_size,
+                input_size=input_size,
+                fitted=fitted,
+                level=level,
+                refit=refit,
+            )
+        if (test_size - h) % step_size:
+            raise Exception("`test_size - h` should be module `step_size`")
+        cutoffs = _cv_cutoffs(h, test_size, step_size)
+        tasks = self._cv_chunk_ranges(len(cutoffs), refit)
         # compute parallel forecasts
         result = {}
-        with Pool(self.n_jobs, **pool_kwargs) as executor:
-            futures = []
-            for ga in gas:
-                future = executor.apply_async(
-                    ga.cross_validation,
+        executor = self._get_pool()
+        futures = []
+        for (start, end), window_range in tasks:
+            future = executor.apply_async(
+                self.ga.view(start, end).cross_validation,
+                (
+                    self.models,
+                    h,
+                    test_size,
+                    step_size,
+                    input_size,
+                    fitted,
+                    level,
+                    refit,
+                    window_range,
+                ),
+            )
+            futures.append(future)
+        out = [f.get() for f in futures]
+        # the tasks are put back in the (serie, window, horizon) order
+        n_cols = out[0]["forecasts"].shape[1]
+        fcsts = np.empty(
+            (self.ga.n_groups, len(cutoffs), h, n_cols), dtype=out[0]["forecasts"].dtype
+        )
+        for ((start, end), (w_start, w_end)), res in zip(tasks, out):
+            fcsts[start:end, w_start:w_end] = res["forecasts"].reshape(
+                end - start, w_end - w_start, h, n_cols
+            )
+        result["forecasts"] = fcsts.reshape(-1, n_cols)
+        result["cols"] = out[0]["cols"]
+        if fitted:
+            starts, sizes = self.ga._cv_train_ranges(cutoffs, input_size)
+            offsets = (np.cumsum(sizes) - sizes.ravel()).reshape(sizes.shape)
+            values = np.empty((sizes.sum(), len(self.models) + 1), dtype=self.ga.dtype)
+            for ((start, end), (w_start, w_end)), res in zip(tasks, out):
+                rows = _segment_rows(
+                    offsets[start:end, w_start], res["fitted"]["sizes"].sum(axis=1)
+                )
+                values[rows] = res["fitted"]["values"]
+            result["fitted"] = {
+                "values": values,
+                "starts": starts,
+                "sizes": sizes,
+                "cols": out[0]["fitted"]["cols"],
+            }
+        return result
+
+    def _cross_validation_shared(
+        self, h, test_size, step_size, input_size, fitted, level, refit=True
+    ):
+        # the workers write their forecasts in the shared outputs
+        if (test_size - h) % step_size:
+            raise Exception("`test_size - h` should be module `step_size`")
+        cutoffs = _cv_cutoffs(h, test_size, step_size)
+        attr = "forecast" if refit is True else "predict"
+        cuts, _ = self.ga._get_cols(
+            models=self.models, attr=attr, h=h, X=None, level=level
+        )
+        result = {}
+        with _SharedArrays() as shared:
+            shared.put_ga("ga", self.ga)
+            shared.empty(
+                "forecasts",
+                (1 + cuts[-1], self.ga.n_groups, len(cutoffs), h),
+                self.ga.dtype,
+            )
+            if fitted:
+                starts, sizes = self.ga._cv_train_ranges(cutoffs, input_size)
+                # each worker writes the fitted values of its (serie, window) starting at their offset
+                offsets = shared.empty("fitted_offsets", sizes.shape, np.int64)
+                offsets[:] = (np.cumsum(sizes) - sizes.ravel()).reshape(sizes.shape)
+                shared.empty(
+                    "fitted_values", (sizes.sum(), len(self.models) + 1), self.ga.dtype
+                )
+            executor = self._get_pool()
+            futures = [
+                executor.apply_async(
+                    _cross_validation_shared,
                     (
+                        shared.specs,
+                        start,
+                        end,
                         self.models,
                         h,
                         test_size,
@@ -747,26 +2339,69 @@ class StatsForecast:
                         input_size,
                         fitted,
                         level,
+                        refit,
+                        window_range,
                     ),
                 )
-                futures.append(future)
-            out = [f.get() for f in futures]
-            fcsts = [d["forecasts"] for d in out]
-            fcsts = np.vstack(fcsts)
-            cols = out[0]["cols"]
-            result["forecasts"] = fcsts
-            result["cols"] = cols
-            if fitted:
-                result["fitted"] = {}
-                result["fitted"]["values"] = np.concatenate(
-                    [d["fitted"]["values"] for d in out]
+                for (start, end), window_range in self._cv_chunk_ranges(
+                    len(cutoffs), refit
                 )
-                for key in ["last_idxs", "idxs"]:
-                    result["fitted"][key] = np.concatenate(
-                        [d["fitted"][key] for d in out]
-                    )
-                result["fitted"]["cols"] = out[0]["fitted"]["cols"]
+            ]
+            result["cols"] = [f.get() for f in futures][0]
+            result["forecasts"] = (
+                shared.arrays["forecasts"].reshape(1 + cuts[-1], -1).T.copy(order="F")
+            )
+            if fitted:
+                result["fitted"] = {
+                    "values": shared.arrays["fitted_values"].copy(),
+                    "starts": starts,
+                    "sizes": sizes,
+                }
+                result["fitted"]["cols"] = ["y"] + [
+                    repr(model) for model in self.models
+                ]
         return result
 
+    def _cross_validation_metrics_parallel(
+        self, h, test_size, step_size, input_size, level, refit, season_length
+    ):
+        # the sums of the errors of the windows of each task are added
+        tasks = self._cv_chunk_ranges(len(_cv_cutoffs(h, test_size, step_size)), refit)
+        args = (
+            self.models,
+            h,
+            test_size,
+            step_size,
+            input_size,
+            level,
+            refit,
+            season_length,
+        )
+        executor = self._get_pool()
+        if self._use_shared_memory():
+            with _SharedArrays() as shared:
+                shared.put_ga("ga", self.ga)
+                futures = [
+                    executor.apply_async(
+                        _cross_validation_metrics_shared,
+                        (shared.specs, start, end, *args, window_range),
+                    )
+                    for (start, end), window_range in tasks
+                ]
+                out = [f.get() for f in futures]
+        else:
+            futures = [
+                executor.apply_async(
+                    self.ga.view(start, end).cross_validation_metrics,
+                    (*args, window_range),
+                )
+                for (start, end), window_range in tasks
+            ]
+            out = [f.get() for f in futures]
+        stats = np.zeros((self.ga.n_groups, out[0]["stats"].shape[1]))
+        for ((start, end), _), res in zip(tasks, out):
+            stats[start:end] += res["stats"]
+        return {"stats": stats, "intervals": out[0]["intervals"]}
+
     def __repr__(self):
         return f"StatsForecast(models=[{','.join(map(repr, self.models))}])"
@@ -0,0 +1,63 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/cv_metrics.ipynb.
+
+# %% auto 0
+__all__ = []
+
+# %% ../nbs/cv_metrics.ipynb 4
+import os
+
+import numpy as np
+from numba import njit
+
+# %% ../nbs/cv_metrics.ipynb 5
+# the compiled kernels are cached on disk with NUMBA_CACHE=true
+CACHE = os.environ.get("NUMBA_CACHE", "False").lower() in ["true"]
+
+# %% ../nbs/cv_metrics.ipynb 6
+@njit(nogil=True, cache=CACHE)
+def _cv_metrics_window(
+    data,
+    indptr,
+    train_starts,
+    train_sizes,
+    y,
+    fcsts,
+    lo,
+    hi,
+    h,
+    season_length,
+    n_stats,
+    stats,
+):
+    # adds the errors of one window to stats, of shape (n_groups, n_models * n_stats + ...).
+    # for each model the n_stats sums of the absolute, squared, symmetric and scaled errors,
+    # followed by the number of actual values inside each interval of lo and hi
+    # and the number of scaled errors
+    n_models = fcsts.shape[1]
+    for i in range(indptr.size - 1):
+        # the errors are scaled by the in-sample mae of the seasonal naive in the training part
+        start = indptr[i] + train_starts[i]
+        n_diffs = train_sizes[i] - season_length
+        scale = np.nan
+        if n_diffs > 0:
+            scale = 0.0
+            for t in range(start + season_length, start + train_sizes[i]):
+                scale += abs(data[t] - data[t - season_length])
+            scale /= n_diffs
+        # windows without a positive scale (constant or too short training part) aren't scaled
+        scaled = scale > 0
+        if scaled:
+            stats[i, -1] += h
+        for j in range(i * h, (i + 1) * h):
+            for m in range(n_models):
+                err = abs(y[j] - fcsts[j, m])
+                stats[i, n_stats * m] += err
+                stats[i, n_stats * m + 1] += err * err
+                denom = abs(y[j]) + abs(fcsts[j, m])
+                if denom > 0:
+                    stats[i, n_stats * m + 2] += err / denom
+                if scaled:
+                    stats[i, n_stats * m + 3] += err / scale
+            for k in range(lo.shape[1]):
+                if lo[j, k] <= y[j] <= hi[j, k]:
+                    stats[i, n_stats * n_models + k] += 1
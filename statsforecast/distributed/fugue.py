@@ -75,13 +75,17 @@ class FugueBackend(ParallelBackend):
 
     def _forecast_series(self, df: pd.DataFrame, models, freq, kwargs) -> pd.DataFrame:
         tdf = df.set_index("unique_id")
-        model = StatsForecast(df=tdf, models=models, freq=freq, n_jobs=1)
-        return model.forecast(**kwargs).reset_index()
+        model = StatsForecast(
+            df=tdf, models=models, freq=freq, n_jobs=1, output="columnar"
+        )
+        return model.forecast(**kwargs).to_pandas(index=False)
 
     def _cv(self, df: pd.DataFrame, models, freq, kwargs) -> pd.DataFrame:
         tdf = df.set_index("unique_id")
-        model = StatsForecast(df=tdf, models=models, freq=freq, n_jobs=1)
-        return model.cross_validation(**kwargs).reset_index()
+        model = StatsForecast(
+            df=tdf, models=models, freq=freq, n_jobs=1, output="columnar"
+        )
+        return model.cross_validation(**kwargs).to_pandas(index=False)
 
     def _get_output_schema(self, models, mode="forecast") -> Schema:
         cols: List[Any]
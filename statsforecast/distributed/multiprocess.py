@@ -16,9 +16,13 @@ class MultiprocessBackend(ParallelBackend):
         super().__init__()
 
     def forecast(self, df, models, freq, **kwargs: Any) -> Any:
-        model = StatsForecast(df=df, models=models, freq=freq, n_jobs=self.n_jobs)
-        return model.forecast(**kwargs)
+        with StatsForecast(
+            df=df, models=models, freq=freq, n_jobs=self.n_jobs
+        ) as model:
+            return model.forecast(**kwargs)
 
     def cross_validation(self, df, models, freq, **kwargs: Any) -> Any:
-        model = StatsForecast(df=df, models=models, freq=freq, n_jobs=self.n_jobs)
-        return model.cross_validation(**kwargs)
+        with StatsForecast(
+            df=df, models=models, freq=freq, n_jobs=self.n_jobs
+        ) as model:
+            return model.cross_validation(**kwargs)
@@ -12,7 +12,6 @@ from typing import Tuple
 
 import numpy as np
 from numba import njit
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 # %% ../nbs/ets.ipynb 4
 # Global variables
@@ -24,7 +23,7 @@ TOL = 1.0e-10
 HUGEN = 1.0e10
 NA = -99999.0
 smalno = np.finfo(float).eps
-NOGIL = os.environ.get("NUMBA_RELEASE_GIL", "False").lower() in ["true"]
+NOGIL = os.environ.get("NUMBA_RELEASE_GIL", "True").lower() in ["true"]
 CACHE = os.environ.get("NUMBA_CACHE", "False").lower() in ["true"]
 
 # %% ../nbs/ets.ipynb 5
@@ -412,6 +411,8 @@ def initstate(y, m, trendtype, seasontype):
                 y_d = dict(seasonal=y / (coefs[0] + coefs[1] * X_fourier[:, 1]))
         else:
             # n is large enough to do a decomposition
+            from statsmodels.tsa.seasonal import seasonal_decompose
+
             y_d = seasonal_decompose(
                 y, period=m, model="additive" if seasontype == "A" else "multiplicative"
             )
@@ -886,6 +887,7 @@ def etsmodel(
     control=None,
     seed=None,
     trace: bool = False,
+    init_par=None,
 ):
     if seasontype == "N":
         m = 1
@@ -899,6 +901,23 @@ def etsmodel(
         alpha, beta, gamma, phi, trendtype, seasontype, damped, lower, upper, m, bounds
     )
     par_noopt = dict(alpha=alpha, beta=beta, gamma=gamma, phi=phi)
+    if init_par is not None:
+        # start the optimizer from the parameters of a previous fit when they're in range
+        warm_par = {
+            key: init_par[i] if np.isnan(par_noopt[key]) and not np.isnan(val) else val
+            for i, (key, val) in enumerate(par_.items())
+        }
+        if check_param(
+            warm_par["alpha"],
+            warm_par["beta"],
+            warm_par["gamma"],
+            warm_par["phi"],
+            lower,
+            upper,
+            bounds,
+            m,
+        ):
+            par_ = warm_par
 
     if not np.isnan(par_["alpha"]):
         alpha = par_["alpha"]
@@ -911,7 +930,12 @@ def etsmodel(
     if not check_param(alpha, beta, gamma, phi, lower, upper, bounds, m):
         raise Exception("Parameters out of range")
     # initialize state
-    init_state = initstate(y, m, trendtype, seasontype)
+    if init_par is None:
+        init_state = initstate(y, m, trendtype, seasontype)
+    else:
+        # the last seasonal state is implied by the others
+        nstate = 1 + (trendtype != "N") + (m - 1) * (seasontype != "N")
+        init_state = init_par[4 : 4 + nstate]
     nstate = len(init_state)
     par_ = {key: val for key, val in par_.items() if not np.isnan(val)}
     par = np.full(len(par_) + nstate, fill_value=np.nan)
@@ -1057,6 +1081,7 @@ def ets_f(
     allow_multiplicative_trend=False,
     use_initial_values=False,
     maxit=2_000,
+    warm_start=None,
 ):
     # converting params to floats
     # to improve numba compilation
@@ -1141,6 +1166,26 @@ def ets_f(
         damped = [True, False]
     else:
         damped = [damped]
+    init_par = None
+    if warm_start is not None:
+        # only the components of a previous fit are estimated, starting from its parameters
+        prev_e, prev_t, prev_s, prev_d = warm_start["components"]
+        prev_d = prev_d == "D"
+        if (
+            (prev_s == "N" or warm_start["m"] == m)
+            and prev_e in errortype
+            and prev_t in trendtype
+            and prev_s in seasontype
+            and prev_d in damped
+            and (data_positive or prev_e != "M")
+        ):
+            errortype, trendtype, seasontype, damped = (
+                [prev_e],
+                [prev_t],
+                [prev_s],
+                [prev_d],
+            )
+            init_par = warm_start["par"]
     best_ic = np.inf
     for etype in errortype:
         for ttype in trendtype:
@@ -1178,6 +1223,7 @@ def ets_f(
                         nmse=nmse,
                         bounds=bounds,
                         maxit=maxit,
+                        init_par=init_par,
                     )
                     fit_ic = fit[ic]
                     if not np.isnan(fit_ic):
@@ -1207,6 +1253,58 @@ def pegelsfcast_C(h, obj, npaths=None, level=None, bootstrap=None):
 def forecast_ets(obj, h):
     fcst = pegelsfcast_C(h, obj)
     out = {"mean": fcst}
-    out["residuals"] = obj["residuals"]
-    out["fitted"] = obj["fitted"]
+    out["residuals"] = obj.get("residuals")
+    out["fitted"] = obj.get("fitted")
     return out
+
+# %% ../nbs/ets.ipynb 33
+def ets_update(obj, y):
+    """Filters new observations with the fitted parameters of the model."""
+    y = np.asarray(y, dtype=np.float64)
+    errortype, trendtype, seasontype, damped = obj["components"]
+    alpha, beta, gamma, phi = obj["par"][:4]
+    # the filter starts from the last state
+    _, e, states, _ = pegelsresid_C(
+        y,
+        obj["m"],
+        obj["states"][-1],
+        errortype,
+        trendtype,
+        seasontype,
+        damped == "D",
+        alpha,
+        beta,
+        gamma,
+        phi,
+        nmse=1,
+    )
+    if errortype == "A":
+        fits = y - e
+    else:
+        fits = y / (1 + e)
+    return {
+        **obj,
+        "residuals": np.hstack([obj["residuals"], e]),
+        "fitted": np.hstack([obj["fitted"], fits]),
+        "states": np.vstack([obj["states"], states[1:]]),
+    }
+
+# %% ../nbs/ets.ipynb 34
+def ets_to_arrays(obj):
+    # the parts of the model used by forecast_ets as flat arrays
+    return {
+        "components": np.frombuffer(obj["components"].encode(), dtype=np.uint8),
+        "par": np.asarray(obj["par"], dtype=np.float64),
+        "states": np.asarray(obj["states"][-1], dtype=np.float64),
+        "m": np.array([obj["m"]], dtype=np.int32),
+    }
+
+
+def ets_from_arrays(arrays):
+    # inverse of ets_to_arrays, the model can only be used for forecasting
+    return {
+        "components": bytes(arrays["components"]).decode(),
+        "par": np.array(arrays["par"]),
+        "states": np.array(arrays["states"]).reshape(1, -1),
+        "m": int(arrays["m"][0]),
+    }
@@ -7,23 +7,37 @@ __all__ = ['AutoARIMA', 'ETS', 'SimpleExponentialSmoothing', 'SimpleExponentialS
            'CrostonOptimized', 'CrostonSBA', 'IMAPA', 'TSB']
 
 # %% ../nbs/models.ipynb 4
+import os
 from typing import Dict, Optional, Sequence, Tuple
 
 import numpy as np
 from numba import njit
-from scipy.optimize import minimize
 
-from .arima import auto_arima_f, forecast_arima, fitted_arima
-from .ets import ets_f, forecast_ets
+# %% ../nbs/models.ipynb 5
+# the compiled kernels are cached on disk with NUMBA_CACHE=true
+CACHE = os.environ.get("NUMBA_CACHE", "False").lower() in ["true"]
 
-# %% ../nbs/models.ipynb 6
+# %% ../nbs/models.ipynb 8
 class _TS:
+    # entries of model_ that predict uses
+    _predict_keys: Tuple[str, ...] = ("mean",)
+
     def new(self):
         b = type(self).__new__(type(self))
         b.__dict__.update(self.__dict__)
         return b
 
-# %% ../nbs/models.ipynb 8
+    def _to_arrays(self):
+        # flat arrays with what predict needs, used by the model store
+        return {key: np.atleast_1d(self.model_[key]) for key in self._predict_keys}
+
+    def _from_arrays(self, arrays):
+        # a copy of the model that can predict from the output of _to_arrays
+        b = self.new()
+        b.model_ = dict(arrays)
+        return b
+
+# %% ../nbs/models.ipynb 10
 class AutoARIMA(_TS):
     def __init__(
         self,
@@ -70,6 +84,7 @@ class AutoARIMA(_TS):
         parallel: bool = False,  # If True and stepwise = False, then the specification search is done in parallel
         num_cores: int = 2,  # Amount of parallel processes to be used
         season_length: int = 1,  # Number of observations per cycle
+        warm_start: bool = False,  # If True, fitting again starts the search from the orders and coefficients of the previous fit
     ):
         self.d = d
         self.D = D
@@ -104,6 +119,7 @@ class AutoARIMA(_TS):
         self.parallel = parallel
         self.num_cores = num_cores
         self.season_length = season_length
+        self.warm_start = warm_start
 
     def __repr__(self):
         return "AutoARIMA"
@@ -113,6 +129,8 @@ class AutoARIMA(_TS):
         y: np.ndarray,  # time series
         X: Optional[np.ndarray] = None,  # exogenous regressors
     ):
+        from .arima import auto_arima_f
+
         with np.errstate(invalid="ignore"):
             self.model_ = auto_arima_f(
                 x=y,
@@ -150,15 +168,40 @@ class AutoARIMA(_TS):
                 parallel=self.parallel,
                 num_cores=self.num_cores,
                 period=self.season_length,
+                warm_start=getattr(self, "model_", None) if self.warm_start else None,
             )
         return self
 
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        from .arima import arima_update
+
+        self.model_ = arima_update(self.model_, y, xreg=X)
+        return self
+
+    def _to_arrays(self):
+        from .arima import arima_to_arrays
+
+        return arima_to_arrays(self.model_)
+
+    def _from_arrays(self, arrays):
+        from .arima import arima_from_arrays
+
+        b = self.new()
+        b.model_ = arima_from_arrays(arrays)
+        return b
+
     def predict(
         self,
         h: int,  # forecasting horizon
         X: np.ndarray = None,  # exogenous regressors
         level: Optional[Tuple[int]] = None,  # level
     ):
+        from .arima import forecast_arima
+
         fcst = forecast_arima(self.model_, h=h, xreg=X, level=level)
         mean = fcst["mean"]
         if level is None:
@@ -172,6 +215,8 @@ class AutoARIMA(_TS):
     def predict_in_sample(self, level: Optional[Tuple[int]] = None):
         if level is not None:
             return NotImplementedError
+        from .arima import fitted_arima
+
         mean = fitted_arima(self.model_)
         return {"mean": mean}
 
@@ -184,6 +229,8 @@ class AutoARIMA(_TS):
         level: Optional[Tuple[int]] = None,  # level
         fitted: bool = False,  # return fitted values?
     ):
+        from .arima import auto_arima_f, fitted_arima, forecast_arima
+
         with np.errstate(invalid="ignore"):
             mod = auto_arima_f(
                 y,
@@ -205,15 +252,17 @@ class AutoARIMA(_TS):
             }
         return res
 
-# %% ../nbs/models.ipynb 31
+# %% ../nbs/models.ipynb 34
 class ETS(_TS):
     def __init__(
         self,
         season_length: int = 1,  # Number of observations per cycle
         model: str = "ZZZ",  # three-character string identifying method using the framework terminology of Hyndman et al. (2002)
+        warm_start: bool = False,  # If True, fitting again only estimates the components of the previous fit starting from its parameters
     ):
         self.season_length = season_length
         self.model = model
+        self.warm_start = warm_start
 
     def __repr__(self):
         return "ETS"
@@ -221,14 +270,43 @@ class ETS(_TS):
     def fit(
         self, y: np.ndarray, X: np.ndarray = None  # time series  # exogenous regressors
     ):
-        self.model_ = ets_f(y, m=self.season_length, model=self.model)
+        from .ets import ets_f
+
+        warm_start = getattr(self, "model_", None) if self.warm_start else None
+        self.model_ = ets_f(
+            y, m=self.season_length, model=self.model, warm_start=warm_start
+        )
         return self
 
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        from .ets import ets_update
+
+        self.model_ = ets_update(self.model_, y)
+        return self
+
+    def _to_arrays(self):
+        from .ets import ets_to_arrays
+
+        return ets_to_arrays(self.model_)
+
+    def _from_arrays(self, arrays):
+        from .ets import ets_from_arrays
+
+        b = self.new()
+        b.model_ = ets_from_arrays(arrays)
+        return b
+
     def predict(
         self,
         h: int,  # forecasting horizon
         X: np.ndarray = None,  # exogenous regressors
     ):
+        from .ets import forecast_ets
+
         mean = forecast_ets(self.model_, h=h)["mean"]
         res = {"mean": mean}
         return res
@@ -245,6 +323,8 @@ class ETS(_TS):
         X_future: np.ndarray = None,  # future regressors
         fitted: bool = False,  # return fitted values?
     ):
+        from .ets import ets_f, forecast_ets
+
         mod = ets_f(y, m=self.season_length, model=self.model)
         fcst = forecast_ets(mod, h)
         keys = ["mean"]
@@ -252,8 +332,8 @@ class ETS(_TS):
             keys.append("fitted")
         return {key: fcst[key] for key in keys}
 
-# %% ../nbs/models.ipynb 41
-@njit
+# %% ../nbs/models.ipynb 45
+@njit(nogil=True, cache=CACHE)
 def _ses_fcst_mse(x: np.ndarray, alpha: float) -> Tuple[float, float, np.ndarray]:
     """Perform simple exponential smoothing on a series.
 
@@ -282,20 +362,20 @@ def _ses_mse(alpha: float, x: np.ndarray) -> float:
     return mse
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _ses_forecast(x: np.ndarray, alpha: float) -> Tuple[float, np.ndarray]:
     """One step ahead forecast with simple exponential smoothing."""
     forecast, _, fitted = _ses_fcst_mse(x, alpha)
     return forecast, fitted
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _demand(x: np.ndarray) -> np.ndarray:
     """Extract the positive elements of a vector."""
     return x[x > 0]
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _intervals(x: np.ndarray) -> np.ndarray:
     """Compute the intervals between non zero elements of a vector."""
     y = []
@@ -311,24 +391,45 @@ def _intervals(x: np.ndarray) -> np.ndarray:
     return np.array(y)
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _probability(x: np.ndarray) -> np.ndarray:
     """Compute the element probabilities of being non zero."""
     return (x != 0).astype(np.int32)
 
 
+@njit(nogil=True, cache=CACHE)
+def _ses_update(
+    forecast: float, x: np.ndarray, alpha: float
+) -> Tuple[float, np.ndarray]:
+    """Updates the one step ahead forecast of a simple exponential smoothing with new observations."""
+    fitted = np.empty(x.size, np.float32)
+    for i in range(x.size):
+        fitted[i] = forecast
+        forecast = alpha * x[i] + (1 - alpha) * forecast
+    return forecast, fitted
+
+
+def _optimized_ses_alpha(
+    x: np.ndarray, bounds: Sequence[Tuple[float, float]] = [(0.1, 0.3)]
+) -> float:
+    """Searches for the optimal alpha of a simple exponential smoothing."""
+    from scipy.optimize import minimize
+
+    return minimize(
+        fun=_ses_mse, x0=(0,), args=(x,), bounds=bounds, method="L-BFGS-B"
+    ).x[0]
+
+
 def _optimized_ses_forecast(
     x: np.ndarray, bounds: Sequence[Tuple[float, float]] = [(0.1, 0.3)]
 ) -> Tuple[float, np.ndarray]:
     """Searches for the optimal alpha and computes SES one step forecast."""
-    alpha = minimize(
-        fun=_ses_mse, x0=(0,), args=(x,), bounds=bounds, method="L-BFGS-B"
-    ).x[0]
+    alpha = _optimized_ses_alpha(x, bounds)
     forecast, fitted = _ses_forecast(x, alpha)
     return forecast, fitted
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     """Splits an array into chunks and returns the sum of each chunk."""
     n = array.size
@@ -339,20 +440,20 @@ def _chunk_sums(array: np.ndarray, chunk_size: int) -> np.ndarray:
     return sums
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _repeat_val(val: float, h: int):
     return np.full(h, val, np.float32)
 
 
-@njit
+@njit(nogil=True, cache=CACHE)
 def _repeat_val_seas(season_vals: np.ndarray, h: int, season_length: int):
     out = np.empty(h, np.float32)
     for i in range(h):
         out[i] = season_vals[i % season_length]
     return out
 
-# %% ../nbs/models.ipynb 42
-@njit
+# %% ../nbs/models.ipynb 46
+@njit(nogil=True, cache=CACHE)
 def _ses(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -366,7 +467,7 @@ def _ses(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 43
+# %% ../nbs/models.ipynb 47
 class SimpleExponentialSmoothing(_TS):
     def __init__(self, alpha: float):  # smoothing parameter
         self.alpha = alpha
@@ -381,6 +482,16 @@ class SimpleExponentialSmoothing(_TS):
         self.model_ = dict(mod)
         return self
 
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        forecast, fitted_vals = _ses_update(self.model_["mean"][0], y, self.alpha)
+        self.model_["mean"] = _repeat_val(val=forecast, h=1)
+        self.model_["fitted"] = np.hstack([self.model_["fitted"], fitted_vals])
+        return self
+
     def predict(
         self,
         h: int,  # forecasting horizon
@@ -405,7 +516,7 @@ class SimpleExponentialSmoothing(_TS):
         out = _ses(y=y, h=h, fitted=fitted, alpha=self.alpha)
         return out
 
-# %% ../nbs/models.ipynb 53
+# %% ../nbs/models.ipynb 57
 def _ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -418,7 +529,7 @@ def _ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 54
+# %% ../nbs/models.ipynb 58
 class SimpleExponentialSmoothingOptimized(_TS):
     def __init__(self):
         pass
@@ -429,8 +540,22 @@ class SimpleExponentialSmoothingOptimized(_TS):
     def fit(
         self, y: np.ndarray, X: np.ndarray = None  # time series  # exogenous regressors
     ):
-        mod = _ses_optimized(y=y, h=1, fitted=True)
-        self.model_ = dict(mod)
+        # the smoothing parameter is kept to update the model
+        alpha = _optimized_ses_alpha(y, [(0.01, 0.99)])
+        mod = _ses(y=y, alpha=alpha, h=1, fitted=True)
+        self.model_ = dict(mod, alpha=alpha)
+        return self
+
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        forecast, fitted_vals = _ses_update(
+            self.model_["mean"][0], y, self.model_["alpha"]
+        )
+        self.model_["mean"] = _repeat_val(val=forecast, h=1)
+        self.model_["fitted"] = np.hstack([self.model_["fitted"], fitted_vals])
         return self
 
     def predict(
@@ -457,8 +582,8 @@ class SimpleExponentialSmoothingOptimized(_TS):
         out = _ses_optimized(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 64
-@njit
+# %% ../nbs/models.ipynb 68
+@njit(nogil=True, cache=CACHE)
 def _seasonal_exponential_smoothing(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -480,7 +605,7 @@ def _seasonal_exponential_smoothing(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 65
+# %% ../nbs/models.ipynb 69
 class SeasonalExponentialSmoothing(_TS):
     def __init__(
         self,
@@ -534,7 +659,7 @@ class SeasonalExponentialSmoothing(_TS):
         )
         return out
 
-# %% ../nbs/models.ipynb 75
+# %% ../nbs/models.ipynb 79
 def _seasonal_ses_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -555,7 +680,7 @@ def _seasonal_ses_optimized(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 76
+# %% ../nbs/models.ipynb 80
 class SeasonalExponentialSmoothingOptimized(_TS):
     def __init__(
         self,
@@ -606,8 +731,8 @@ class SeasonalExponentialSmoothingOptimized(_TS):
         )
         return out
 
-# %% ../nbs/models.ipynb 87
-@njit
+# %% ../nbs/models.ipynb 91
+@njit(nogil=True, cache=CACHE)
 def _historic_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -621,7 +746,26 @@ def _historic_average(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 88
+
+@njit(nogil=True, cache=CACHE)
+def _historic_average_panel(
+    y: np.ndarray,  # time series of all groups
+    indptr: np.ndarray,  # boundaries of each group in `y`
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_groups = indptr.size - 1
+    mean = np.empty(n_groups * h, y.dtype)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        grp = y[start:end]
+        mean[i * h : (i + 1) * h] = grp.mean()
+        if fitted:
+            fitted_vals[start + 1 : end] = grp.cumsum()[:-1] / np.arange(1, grp.size)
+    return mean, fitted_vals
+
+# %% ../nbs/models.ipynb 92
 class HistoricAverage(_TS):
     def __init__(self):
         pass
@@ -636,6 +780,19 @@ class HistoricAverage(_TS):
         self.model_ = dict(mod)
         return self
 
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        n = self.model_["fitted"].size
+        sums = self.model_["mean"][0] * n + np.cumsum(y, dtype=np.float64)
+        means = sums / np.arange(n + 1, n + y.size + 1)
+        fitted_vals = np.hstack([self.model_["mean"][0], means[:-1]]).astype(np.float32)
+        self.model_["mean"] = _repeat_val(val=means[-1], h=1)
+        self.model_["fitted"] = np.hstack([self.model_["fitted"], fitted_vals])
+        return self
+
     def predict(
         self,
         h: int,  # forecasting horizon
@@ -660,8 +817,23 @@ class HistoricAverage(_TS):
         out = _historic_average(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 98
-@njit
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _historic_average_panel(
+            y=y, indptr=indptr, h=h, fitted=fitted
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 103
+@njit(nogil=True, cache=CACHE)
 def _naive(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -674,7 +846,25 @@ def _naive(
         return {"mean": mean, "fitted": fitted_vals}
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 99
+
+@njit(nogil=True, cache=CACHE)
+def _naive_panel(
+    y: np.ndarray,  # time series of all groups
+    indptr: np.ndarray,  # boundaries of each group in `y`
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_groups = indptr.size - 1
+    mean = np.empty(n_groups * h, y.dtype)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        mean[i * h : (i + 1) * h] = y[end - 1]
+        if fitted:
+            fitted_vals[start + 1 : end] = y[start : end - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/models.ipynb 104
 class Naive(_TS):
     def __init__(self):
         pass
@@ -689,6 +879,16 @@ class Naive(_TS):
         self.model_ = dict(mod)
         return self
 
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        fitted_vals = np.hstack([self.model_["mean"][0], y[:-1]]).astype(np.float32)
+        self.model_["mean"] = _repeat_val(val=y[-1], h=1)
+        self.model_["fitted"] = np.hstack([self.model_["fitted"], fitted_vals])
+        return self
+
     def predict(
         self,
         h: int,  # forecasting horizon
@@ -713,8 +913,21 @@ class Naive(_TS):
         out = _naive(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 109
-@njit
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _naive_panel(y=y, indptr=indptr, h=h, fitted=fitted)
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 115
+@njit(nogil=True, cache=CACHE)
 def _random_walk_with_drift(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -733,8 +946,29 @@ def _random_walk_with_drift(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 110
+
+@njit(nogil=True, cache=CACHE)
+def _random_walk_with_drift_panel(
+    y: np.ndarray,  # time series of all groups
+    indptr: np.ndarray,  # boundaries of each group in `y`
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+):
+    n_groups = indptr.size - 1
+    mean = np.empty(n_groups * h, y.dtype)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        slope = (y[end - 1] - y[start]) / (end - start - 1)
+        mean[i * h : (i + 1) * h] = slope * (1 + np.arange(h)) + y[end - 1]
+        if fitted:
+            fitted_vals[start + 1 : end] = slope + y[start : end - 1]
+    return mean, fitted_vals
+
+# %% ../nbs/models.ipynb 116
 class RandomWalkWithDrift(_TS):
+    _predict_keys = ("slope", "last_y")
+
     def __init__(self):
         pass
 
@@ -773,8 +1007,23 @@ class RandomWalkWithDrift(_TS):
         out = _random_walk_with_drift(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 120
-@njit
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _random_walk_with_drift_panel(
+            y=y, indptr=indptr, h=h, fitted=fitted
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 127
+@njit(nogil=True, cache=CACHE)
 def _seasonal_naive(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -796,7 +1045,34 @@ def _seasonal_naive(
         fcst["fitted"] = fitted_vals
     return fcst
 
-# %% ../nbs/models.ipynb 121
+
+@njit(nogil=True, cache=CACHE)
+def _seasonal_naive_panel(
+    y: np.ndarray,  # time series of all groups
+    indptr: np.ndarray,  # boundaries of each group in `y`
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+    season_length: int,  # season length
+):
+    n_groups = indptr.size - 1
+    mean = np.full(n_groups * h, np.nan, y.dtype)
+    fitted_vals = np.full(y.size if fitted else 0, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        size = end - start
+        if size >= season_length:
+            for j in range(h):
+                # last observation of the season j belongs to
+                season = j % season_length
+                last = season + ((size - 1 - season) // season_length) * season_length
+                mean[i * h + j] = y[start + last]
+            if fitted:
+                fitted_vals[start + season_length : end] = y[
+                    start : end - season_length
+                ]
+    return mean, fitted_vals
+
+# %% ../nbs/models.ipynb 128
 class SeasonalNaive(_TS):
     def __init__(self, season_length: int):  # Number of observations per cycle
         self.season_length = season_length
@@ -842,8 +1118,23 @@ class SeasonalNaive(_TS):
         out = _seasonal_naive(y=y, h=h, fitted=fitted, season_length=self.season_length)
         return out
 
-# %% ../nbs/models.ipynb 131
-@njit
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _seasonal_naive_panel(
+            y=y, indptr=indptr, h=h, fitted=fitted, season_length=self.season_length
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 139
+@njit(nogil=True, cache=CACHE)
 def _window_average(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -858,7 +1149,26 @@ def _window_average(
     mean = _repeat_val(val=wavg, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 132
+
+@njit(nogil=True, cache=CACHE)
+def _window_average_panel(
+    y: np.ndarray,  # time series of all groups
+    indptr: np.ndarray,  # boundaries of each group in `y`
+    h: int,  # forecasting horizon
+    fitted: bool,  # fitted values
+    window_size: int,  # window size
+):
+    if fitted:
+        raise NotImplementedError("return fitted")
+    n_groups = indptr.size - 1
+    mean = np.full(n_groups * h, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start >= window_size:
+            mean[i * h : (i + 1) * h] = y[end - window_size : end].mean()
+    return mean, np.empty(0, y.dtype)
+
+# %% ../nbs/models.ipynb 140
 class WindowAverage(_TS):
     def __init__(self, window_size: int):  # last observations used to compute average
         self.window_size = window_size
@@ -870,7 +1180,17 @@ class WindowAverage(_TS):
         self, y: np.ndarray, X: np.ndarray = None  # time series  # exogenous regressors
     ):
         mod = _window_average(y=y, h=1, window_size=self.window_size, fitted=False)
-        self.model_ = dict(mod)
+        self.model_ = dict(mod, window=y[-self.window_size :].copy())
+        return self
+
+    def update(
+        self,
+        y: np.ndarray,  # new observations of the time series
+        X: np.ndarray = None,  # new exogenous regressors
+    ):
+        window = np.hstack([self.model_["window"], y])[-self.window_size :]
+        mod = _window_average(y=window, h=1, window_size=self.window_size, fitted=False)
+        self.model_ = dict(mod, window=window)
         return self
 
     def predict(
@@ -896,8 +1216,23 @@ class WindowAverage(_TS):
         out = _window_average(y=y, h=h, fitted=fitted, window_size=self.window_size)
         return out
 
-# %% ../nbs/models.ipynb 142
-@njit
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _window_average_panel(
+            y=y, indptr=indptr, h=h, fitted=fitted, window_size=self.window_size
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 151
+@njit(nogil=True, cache=CACHE)
 def _seasonal_window_average(
     y: np.ndarray,
     h: int,
@@ -917,7 +1252,32 @@ def _seasonal_window_average(
     out = _repeat_val_seas(season_vals=season_avgs, h=h, season_length=season_length)
     return {"mean": out}
 
-# %% ../nbs/models.ipynb 143
+
+@njit(nogil=True, cache=CACHE)
+def _seasonal_window_average_panel(
+    y: np.ndarray,
+    indptr: np.ndarray,
+    h: int,
+    fitted: bool,
+    season_length: int,
+    window_size: int,
+):
+    if fitted:
+        raise NotImplementedError("return fitted")
+    n_groups = indptr.size - 1
+    min_samples = season_length * window_size
+    mean = np.full(n_groups * h, np.nan, y.dtype)
+    for i in range(n_groups):
+        start, end = indptr[i], indptr[i + 1]
+        if end - start >= min_samples:
+            season_avgs = np.zeros(season_length, y.dtype)
+            for k in range(min_samples):
+                season_avgs[k % season_length] += y[end - min_samples + k] / window_size
+            for j in range(h):
+                mean[i * h + j] = season_avgs[j % season_length]
+    return mean, np.empty(0, y.dtype)
+
+# %% ../nbs/models.ipynb 152
 class SeasonalWindowAverage(_TS):
     def __init__(
         self,
@@ -974,7 +1334,27 @@ class SeasonalWindowAverage(_TS):
         )
         return out
 
-# %% ../nbs/models.ipynb 155
+    def forecast_panel(
+        self,
+        y: np.ndarray,  # time series of all groups
+        indptr: np.ndarray,  # boundaries of each group in `y`
+        h: int,  # forecasting horizon
+        fitted: bool = False,  # return fitted values?
+    ):
+        mean, fitted_vals = _seasonal_window_average_panel(
+            y=y,
+            indptr=indptr,
+            h=h,
+            fitted=fitted,
+            season_length=self.season_length,
+            window_size=self.window_size,
+        )
+        res = {"mean": mean}
+        if fitted:
+            res["fitted"] = fitted_vals
+        return res
+
+# %% ../nbs/models.ipynb 165
 def _adida(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -995,7 +1375,7 @@ def _adida(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 156
+# %% ../nbs/models.ipynb 166
 class ADIDA(_TS):
     def __init__(self):
         pass
@@ -1033,8 +1413,8 @@ class ADIDA(_TS):
         out = _adida(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 166
-@njit
+# %% ../nbs/models.ipynb 176
+@njit(nogil=True, cache=CACHE)
 def _croston_classic(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1053,7 +1433,7 @@ def _croston_classic(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 167
+# %% ../nbs/models.ipynb 177
 class CrostonClassic(_TS):
     def __init__(self):
         pass
@@ -1091,7 +1471,7 @@ class CrostonClassic(_TS):
         out = _croston_classic(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 177
+# %% ../nbs/models.ipynb 187
 def _croston_optimized(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1110,7 +1490,7 @@ def _croston_optimized(
     mean = _repeat_val(val=mean, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 178
+# %% ../nbs/models.ipynb 188
 class CrostonOptimized(_TS):
     def __init__(self):
         pass
@@ -1148,8 +1528,8 @@ class CrostonOptimized(_TS):
         out = _croston_optimized(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 188
-@njit
+# %% ../nbs/models.ipynb 198
+@njit(nogil=True, cache=CACHE)
 def _croston_sba(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1161,7 +1541,7 @@ def _croston_sba(
     mean["mean"] *= 0.95
     return mean
 
-# %% ../nbs/models.ipynb 189
+# %% ../nbs/models.ipynb 199
 class CrostonSBA(_TS):
     def __init__(self):
         pass
@@ -1201,7 +1581,7 @@ class CrostonSBA(_TS):
         out = _croston_sba(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 199
+# %% ../nbs/models.ipynb 209
 def _imapa(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1225,7 +1605,7 @@ def _imapa(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 200
+# %% ../nbs/models.ipynb 210
 class IMAPA(_TS):
     def __init__(self):
         pass
@@ -1263,8 +1643,8 @@ class IMAPA(_TS):
         out = _imapa(y=y, h=h, fitted=fitted)
         return out
 
-# %% ../nbs/models.ipynb 210
-@njit
+# %% ../nbs/models.ipynb 220
+@njit(nogil=True, cache=CACHE)
 def _tsb(
     y: np.ndarray,  # time series
     h: int,  # forecasting horizon
@@ -1284,7 +1664,7 @@ def _tsb(
     mean = _repeat_val(val=forecast, h=h)
     return {"mean": mean}
 
-# %% ../nbs/models.ipynb 211
+# %% ../nbs/models.ipynb 221
 class TSB(_TS):
     def __init__(
         self,
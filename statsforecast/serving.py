@@ -0,0 +1,169 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/serving.ipynb.
+
+# %% auto 0
+__all__ = ['ForecastServer']
+
+# %% ../nbs/serving.ipynb 3
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from .core import ColumnarResult
+
+# %% ../nbs/serving.ipynb 4
+class _Request(NamedTuple):
+    ids: Sequence
+    h: int
+    level: Optional[tuple]
+    future: asyncio.Future
+
+
+def _slice_rows(res, start, end):
+    # rows [start, end) of the output of predict
+    if isinstance(res, ColumnarResult):
+        return ColumnarResult(
+            ids=res.ids[start:end],
+            dates={col: dates[start:end] for col, dates in res.dates.items()},
+            values=res.values[start:end],
+            cols=res.cols,
+        )
+    return res.iloc[start:end]
+
+# %% ../nbs/serving.ipynb 5
+class ForecastServer:
+    """Serves the forecasts of fitted models to concurrent requests.
+
+    The requests that arrive within `max_wait` seconds of the first one are
+    predicted with a single call to `predict` of the models and each request
+    gets the rows of its series. A batch has at most `max_batch_size` series,
+    unless it has a single request with more of them.
+    """
+
+    def __init__(
+        self,
+        models: Any,  # Fitted `StatsForecast` or `ModelStore` with the models to serve
+        max_batch_size: int = 1_024,  # Maximum number of series predicted in a single call
+        max_wait: float = 0.002,  # Seconds that a batch waits for more requests
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be at least 1, got {max_batch_size}")
+        self.models = models
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.n_batches = 0
+        self._queue = None
+        self._task = None
+        self._executor = None
+
+    async def start(self):
+        """Starts batching the requests in the running event loop."""
+        if self._task is None:
+            # the batches run one after the other in a thread, so the event loop keeps accepting requests
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._batch_loop())
+        return self
+
+    async def stop(self):
+        """Predicts the pending requests and stops the batching."""
+        if self._task is not None:
+            await self._queue.put(None)
+            await self._task
+            self._executor.shutdown(wait=True)
+            self._queue = self._task = self._executor = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def forecast(
+        self,
+        ids: Sequence,  # Series to forecast
+        h: int,  # Forecast horizon
+        level: Optional[List[int]] = None,  # Levels of probabilistic intervals
+    ):
+        """Forecasts of the series `ids`, in the output type of `models`."""
+        if self._task is None:
+            raise RuntimeError("The server has to be started before forecasting")
+        future = asyncio.get_running_loop().create_future()
+        level = None if level is None else tuple(level)
+        await self._queue.put(_Request(list(ids), h, level, future))
+        return await future
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        # request that didn't fit in the previous batch and starts the next one
+        pending = None
+        stop = False
+        while not stop:
+            request = pending if pending is not None else await self._queue.get()
+            pending = None
+            if request is None:
+                break
+            batch = [request]
+            n_series = len(request.ids)
+            deadline = loop.time() + self.max_wait
+            while n_series < self.max_batch_size:
+                try:
+                    request = await asyncio.wait_for(
+                        self._queue.get(), max(deadline - loop.time(), 0)
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                if n_series + len(request.ids) > self.max_batch_size:
+                    pending = request
+                    break
+                batch.append(request)
+                n_series += len(request.ids)
+            try:
+                await self._predict_batch(batch)
+            except Exception as e:
+                # the requests of the batch fail instead of waiting forever
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+    async def _predict_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        groups = {}
+        for request in batch:
+            groups.setdefault((request.h, request.level), []).append(request)
+        for (h, level), requests in groups.items():
+            ids = [uid for request in requests for uid in request.ids]
+            predict = partial(self.models.predict, h=h, ids=ids, level=level)
+            try:
+                res = await loop.run_in_executor(self._executor, predict)
+            except Exception:
+                # the requests are predicted one by one, so only the wrong ones fail
+                for request in requests:
+                    await self._predict_request(request)
+                continue
+            self.n_batches += 1
+            start = 0
+            for request in requests:
+                end = start + h * len(request.ids)
+                if not request.future.done():
+                    request.future.set_result(_slice_rows(res, start, end))
+                start = end
+
+    async def _predict_request(self, request):
+        predict = partial(
+            self.models.predict, h=request.h, ids=request.ids, level=request.level
+        )
+        try:
+            res = await asyncio.get_running_loop().run_in_executor(
+                self._executor, predict
+            )
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+            return
+        self.n_batches += 1
+        if not request.future.done():
+            request.future.set_result(res)